@@ -12,6 +12,7 @@ Date: September 30, 2025
 __version__ = "1.0.0"
 
 import os
+import re
 import json
 import warnings
 import pymel.core as pm
@@ -19,12 +20,55 @@ from typing import List, Dict, Tuple, Optional, Any, Union, Set
 from enum import Enum
 import logging
 from contextlib import contextmanager
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Prefer a faster JSON codec for pose file I/O when one is installed
+try:
+    import orjson as _json_codec
+except ImportError:
+    try:
+        import ujson as _json_codec
+    except ImportError:
+        _json_codec = json
+
+
+def _json_dumps(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON using the fastest available codec.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        bytes: UTF-8 encoded JSON indented by two spaces
+    """
+    if _json_codec.__name__ == 'orjson':
+        return _json_codec.dumps(data, option=_json_codec.OPT_INDENT_2)
+    if _json_codec.__name__ == 'ujson':
+        return _json_codec.dumps(data, indent=2, escape_forward_slashes=False).encode('utf-8')
+    return _json_codec.dumps(data, indent=2).encode('utf-8')
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes using the fastest available codec.
+    
+    Args:
+        data: JSON document to parse
+        
+    Returns:
+        Any: Parsed data
+    """
+    return _json_codec.loads(data)
+
+
+# Attributes skipped by default; a frozenset keeps membership checks O(1)
+_EXCLUDED_ATTRS = frozenset(("scaleX", "scaleY", "scaleZ"))
+
 
 class ControlSelectionMode(Enum):
     """Enumeration for different control selection methods."""
@@ -90,8 +134,20 @@ class FacialPoseData:
     maya_version: str = ""
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert pose data to dictionary for serialization."""
-        return asdict(self)
+        """
+        Convert pose data to dictionary for serialization.
+        
+        Built field by field rather than with dataclasses.asdict, which deep-copies
+        recursively; the control dicts are still copied so callers cannot mutate the pose.
+        """
+        return {
+            "name": self.name,
+            "attribute_name": self.attribute_name,
+            "controls": {control: dict(attrs) for control, attrs in self.controls.items()},
+            "description": self.description,
+            "timestamp": self.timestamp,
+            "maya_version": self.maya_version,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FacialPoseData':
@@ -143,7 +199,10 @@ class FacialPoseAnimator:
         self.facial_driver_node = "FacialPoseValue"
         self.control_pattern = "::*_CTRL"
         self.excluded_nodes = ["GUI", "pup"]
-        self.excluded_attributes = ["scaleX", "scaleY", "scaleZ"]
+        self.excluded_attributes = _EXCLUDED_ATTRS
+        # Compiled excluded-node matcher, rebuilt when excluded_nodes changes
+        self._excluded_nodes_key: Optional[Tuple[str, ...]] = None
+        self._excluded_nodes_re: Optional["re.Pattern"] = None
         self.tolerance = 0.01
         
         # Default control selection settings
@@ -157,8 +216,9 @@ class FacialPoseAnimator:
         
         # Undo/cleanup tracking
         self.created_nodes: Set[str] = set()
-        self.created_connections: List[Tuple[str, str]] = []
-        self.created_attributes: List[Tuple[str, str]] = []  # (node, attribute)
+        # Insertion-ordered dicts used as sets: O(1) membership, ordered cleanup
+        self.created_connections: Dict[Tuple[str, str], None] = {}
+        self.created_attributes: Dict[Tuple[str, str], None] = {}  # (node, attribute)
         self.enable_undo_tracking = True
         
         # Pose management settings
@@ -331,6 +391,23 @@ class FacialPoseAnimator:
         """
         return self.custom_limits.copy()
     
+    def _excluded_nodes_pattern(self) -> Optional["re.Pattern"]:
+        """
+        Get a compiled regex matching any excluded node substring.
+        
+        The pattern is cached and only rebuilt when excluded_nodes changes.
+        
+        Returns:
+            Optional[re.Pattern]: Compiled pattern, or None if nothing is excluded
+        """
+        key = tuple(self.excluded_nodes)
+        if key != self._excluded_nodes_key:
+            self._excluded_nodes_re = (
+                re.compile("|".join(map(re.escape, key))) if key else None
+            )
+            self._excluded_nodes_key = key
+        return self._excluded_nodes_re
+    
     def _is_valid_control(self, control: pm.PyNode) -> bool:
         """
         Check if a control node is valid for processing.
@@ -348,7 +425,8 @@ class FacialPoseAnimator:
         node_name = control.nodeName()
         
         # Check excluded nodes
-        if any(excluded in node_name for excluded in self.excluded_nodes):
+        excluded_re = self._excluded_nodes_pattern()
+        if excluded_re is not None and excluded_re.search(node_name):
             return False
         
         # Check if this node is a driver node
@@ -879,14 +957,14 @@ class FacialPoseAnimator:
     def _track_created_connection(self, source_attr: str, dest_attr: str) -> None:
         """Track a connection that was created during operations for potential cleanup."""
         if self.enable_undo_tracking:
-            self.created_connections.append((source_attr, dest_attr))
+            self.created_connections[(source_attr, dest_attr)] = None
             logger.debug(f"Tracking created connection: {source_attr} -> {dest_attr}")
     
     def _track_created_attribute(self, node: Union[pm.PyNode, str], attr_name: str) -> None:
         """Track an attribute that was created during operations for potential cleanup."""
         if self.enable_undo_tracking:
             node_name = str(node)
-            self.created_attributes.append((node_name, attr_name))
+            self.created_attributes[(node_name, attr_name)] = None
             logger.debug(f"Tracking created attribute: {node_name}.{attr_name}")
     
     def _cleanup_created_items(self) -> None:
@@ -897,7 +975,7 @@ class FacialPoseAnimator:
         cleanup_errors = []
         
         # Disconnect created connections
-        for source_attr, dest_attr in reversed(self.created_connections):
+        for source_attr, dest_attr in reversed(list(self.created_connections)):
             try:
                 if pm.isConnected(source_attr, dest_attr):
                     pm.disconnectAttr(source_attr, dest_attr)
@@ -906,7 +984,7 @@ class FacialPoseAnimator:
                 cleanup_errors.append(f"Failed to disconnect {source_attr} -> {dest_attr}: {e}")
         
         # Remove created attributes
-        for node_name, attr_name in reversed(self.created_attributes):
+        for node_name, attr_name in reversed(list(self.created_attributes)):
             try:
                 if pm.objExists(node_name) and pm.attributeQuery(attr_name, node=node_name, exists=True):
                     pm.deleteAttr(f"{node_name}.{attr_name}")
@@ -2283,8 +2361,8 @@ class FacialPoseAnimator:
                 os.makedirs(output_dir)
             
             # Write to file
-            with open(file_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(_json_dumps(export_data))
             
         except (OSError, IOError, PermissionError) as e:
             raise FileOperationError(f"Failed to save pose to file '{file_path}': {e}") from e
@@ -2410,55 +2488,91 @@ class FacialPoseAnimator:
             logger.warning(f"Pose '{pose_name}' not found in saved poses.")
             return False
     
-    def export_poses_to_file(self, file_path: str, pose_names: Optional[List[str]] = None) -> None:
+    def build_poses_export_data(self, pose_names: Optional[List[str]] = None) -> Dict[str, Any]:
         """
-        Export saved poses to a JSON file.
+        Build the JSON-ready export data for saved poses.
+        
+        This queries Maya for version information, so call it from the main thread.
         
         Args:
-            file_path: Path to save the poses file
             pose_names: Optional list of specific pose names to export (exports all if None)
             
+        Returns:
+            Dict[str, Any]: Export data ready to be written with write_poses_export_data()
+            
         Raises:
-            PoseDataError: If export fails
+            PoseDataError: If there are no poses to export
+        """
+        # Determine which poses to export
+        if pose_names is None:
+            poses_to_export = self.saved_poses
+        else:
+            poses_to_export = {name: self.saved_poses[name] for name in pose_names if name in self.saved_poses}
+        
+        if not poses_to_export:
+            raise PoseDataError("No poses found to export.")
+        
+        # Prepare export data
+        from datetime import datetime
+        return {
+            'version': '1.0',
+            'created_timestamp': datetime.now().isoformat(),
+            'maya_version': pm.about(version=True),
+            'facial_driver_node': self.facial_driver_node,
+            'control_pattern': self.control_pattern,
+            'poses': {name: pose.to_dict() for name, pose in poses_to_export.items()}
+        }
+    
+    def write_poses_export_data(self, file_path: str, export_data: Dict[str, Any]) -> None:
+        """
+        Write export data built by build_poses_export_data() to a JSON file.
+        
+        Only file and JSON work happens here (no Maya calls), so it is safe to run
+        from a worker thread.
+        
+        Args:
+            file_path: Path to save the poses file
+            export_data: Export data to write
+            
+        Raises:
+            PoseDataError: If the data cannot be serialized
             FileOperationError: If file cannot be written
         """
         try:
-            # Determine which poses to export
-            if pose_names is None:
-                poses_to_export = self.saved_poses
-            else:
-                poses_to_export = {name: self.saved_poses[name] for name in pose_names if name in self.saved_poses}
-            
-            if not poses_to_export:
-                raise PoseDataError("No poses found to export.")
-            
-            # Prepare export data
-            from datetime import datetime
-            export_data = {
-                'version': '1.0',
-                'created_timestamp': datetime.now().isoformat(),
-                'maya_version': pm.about(version=True),
-                'facial_driver_node': self.facial_driver_node,
-                'control_pattern': self.control_pattern,
-                'poses': {name: pose.to_dict() for name, pose in poses_to_export.items()}
-            }
-            
             # Create directory if it doesn't exist
             output_dir = os.path.dirname(file_path)
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir)
             
             # Write to file
-            with open(file_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(_json_dumps(export_data))
             
             self.pose_storage_file = file_path
-            logger.info(f"Exported {len(poses_to_export)} poses to: {file_path}")
+            logger.info(f"Exported {len(export_data.get('poses', {}))} poses to: {file_path}")
             
         except (OSError, IOError, PermissionError) as e:
             raise FileOperationError(f"Failed to write poses to file '{file_path}': {e}") from e
         except (ValueError, TypeError) as e:  # JSONEncodeError is a subclass of ValueError
             raise PoseDataError(f"Failed to serialize pose data: {e}") from e
+    
+    def export_poses_to_file(self, file_path: str, pose_names: Optional[List[str]] = None) -> None:
+        """
+        Export saved poses to a JSON file.
+        
+        Args:
+            file_path: Path to save the poses file
+            pose_names: Optional list of specific pose names to export (exports all if None)
+            
+        Raises:
+            PoseDataError: If export fails
+            FileOperationError: If file cannot be written
+        """
+        try:
+            export_data = self.build_poses_export_data(pose_names)
+            self.write_poses_export_data(file_path, export_data)
+        except FacialAnimatorError:
+            raise
         except Exception as e:
             raise PoseDataError(f"Unexpected error exporting poses: {e}") from e
     
@@ -2482,8 +2596,8 @@ class FacialPoseAnimator:
                 raise FileOperationError(f"Poses file not found: {file_path}")
             
             # Read and parse file
-            with open(file_path, 'r') as f:
-                import_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                import_data = _json_loads(f.read())
             
             # Validate file format
             if 'poses' not in import_data:
@@ -2532,6 +2646,87 @@ class FacialPoseAnimator:
         except Exception as e:
             raise PoseDataError(f"Unexpected error importing poses: {e}") from e
     
+    def read_pose_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Read and parse a pose file without importing any poses.
+        
+        Only file and JSON work happens here (no Maya calls), so it is safe to run
+        from a worker thread.
+        
+        Args:
+            file_path: Path to a single pose or multi-pose JSON file
+            
+        Returns:
+            Dict[str, Any]: Parsed file contents, ready for iter_import_poses()
+            
+        Raises:
+            PoseDataError: If the file is not valid JSON
+            FileOperationError: If file cannot be read
+        """
+        if not os.path.exists(file_path):
+            raise FileOperationError(f"Poses file not found: {file_path}")
+        
+        try:
+            with open(file_path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, IOError, PermissionError) as e:
+            raise FileOperationError(f"Failed to read poses file '{file_path}': {e}") from e
+        except ValueError as e:  # JSONDecodeError is a subclass of ValueError
+            raise PoseDataError(f"Invalid JSON format in poses file: {e}") from e
+    
+    def iter_import_poses(self, import_data: Dict[str, Any],
+                          overwrite_existing: bool = False):
+        """
+        Import poses from parsed pose file data one pose at a time.
+        
+        Both the multi-pose export format and the single pose format are accepted.
+        Consuming the generator lazily lets callers report progress or stop early.
+        
+        Args:
+            import_data: Parsed pose file contents (see read_pose_file())
+            overwrite_existing: Whether to overwrite existing poses with same names
+            
+        Yields:
+            Tuple[int, int, Optional[str]]: (1-based index, total poses, name of the
+            imported pose or None if it was skipped)
+            
+        Raises:
+            PoseDataError: If the data is not in a recognized pose file format
+        """
+        if not isinstance(import_data, dict):
+            raise PoseDataError("Invalid poses file format: expected a JSON object.")
+        
+        if import_data.get('export_type') == 'single_pose' and 'pose' in import_data:
+            pose_dict = import_data['pose']
+            if not isinstance(pose_dict, dict):
+                raise PoseDataError("Invalid pose file format: 'pose' must be a JSON object.")
+            poses = {pose_dict.get('name', 'Imported_Pose'): pose_dict}
+        elif 'poses' in import_data:
+            poses = import_data['poses']
+            if not isinstance(poses, dict):
+                raise PoseDataError("Invalid poses file format: 'poses' must be a JSON object.")
+        else:
+            raise PoseDataError("Invalid poses file format: missing 'poses' key.")
+        
+        total = len(poses)
+        for index, (pose_name, pose_dict) in enumerate(poses.items(), 1):
+            imported_name = None
+            
+            if pose_name in self.saved_poses and not overwrite_existing:
+                logger.info(f"Skipped existing pose '{pose_name}' (use overwrite_existing=True to replace).")
+            else:
+                try:
+                    pose_data = FacialPoseData.from_dict(pose_dict)
+                    if pose_data.is_valid():
+                        self.saved_poses[pose_name] = pose_data
+                        imported_name = pose_name
+                    else:
+                        logger.warning(f"Skipping invalid pose data: {pose_name}")
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Error importing pose '{pose_name}': {e}")
+            
+            yield index, total, imported_name
+    
     def load_single_pose_from_file(self, file_path: str, overwrite_existing: bool = False) -> Optional[str]:
         """
         Load a single pose from a JSON file.
@@ -2552,8 +2747,8 @@ class FacialPoseAnimator:
                 raise FileOperationError(f"Pose file not found: {file_path}")
             
             # Read and parse file
-            with open(file_path, 'r') as f:
-                import_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                import_data = _json_loads(f.read())
             
             # Check if it's a single pose file
             if 'pose' in import_data and 'export_type' in import_data:
@@ -3582,8 +3777,8 @@ def get_pose_files_in_directory(directory: Optional[str] = None) -> List[str]:
                 file_path = os.path.join(directory, filename)
                 try:
                     # Quick validation that it's a pose file
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
+                    with open(file_path, 'rb') as f:
+                        data = _json_loads(f.read())
                         if 'pose' in data or 'poses' in data:
                             pose_files.append(file_path)
                 except:
@@ -10,18 +10,22 @@ Date: October 1, 2025
 Updated: October 7, 2025 - Migrated to use new unified API with improved error handling
 
 Changes (October 7, 2025):
-- Imported new unified API functions (safe_animate_poses, safe_create_driver, safe_save_pose, safe_load_poses)
+- Imported new unified API functions (safe_animate_poses, safe_create_driver, safe_save_pose)
 - Imported exception classes for proper error handling (FacialAnimatorError and subclasses)
 - Updated animate_facial_poses_handler() to use safe_animate_poses with specific exception handling
 - Updated save_pose() to use safe_save_pose with specific exception handling
 - Updated create_driver() to use safe_create_driver with specific exception handling
-- Updated load_poses_from_file() to use safe_load_poses
+- Updated load_poses_from_file() to read the file off the UI thread (read_pose_file) and import
+  poses incrementally with iter_import_poses
 - All UI operations now use "safe" variants that return None on error instead of raising exceptions
 - Improved error messages with specific exception types (ControlSelectionError, DriverNodeError, etc.)
 """
 
+import os
 import sys
-from typing import Dict, Any
+import functools
+from collections import deque
+from typing import Dict, Any, List, Tuple
 
 # Try to import PySide6, fallback to PySide2
 try:
@@ -30,9 +34,10 @@ try:
         QPushButton, QLabel, QLineEdit, QTextEdit, QComboBox, QSpinBox,
         QDoubleSpinBox, QCheckBox, QGroupBox, QListWidget, QListWidgetItem,
         QFileDialog, QMessageBox, QTabWidget, QProgressBar, QSplitter,
-        QTableWidget, QTableWidgetItem, QHeaderView, QDialog, QDialogButtonBox
+        QTableWidget, QTableWidgetItem, QHeaderView, QDialog, QDialogButtonBox, QMenu,
+        QProgressDialog
     )
-    from PySide6.QtCore import Qt, Signal, QTimer, QSize
+    from PySide6.QtCore import Qt, Signal, QTimer, QSize, QObject, QRunnable, QThreadPool, QSignalBlocker, QSettings
     from PySide6.QtGui import QIcon, QFont, QColor
     PYSIDE_VERSION = 6
     print("Using PySide6")
@@ -43,9 +48,10 @@ except ImportError:
             QPushButton, QLabel, QLineEdit, QTextEdit, QComboBox, QSpinBox,
             QDoubleSpinBox, QCheckBox, QGroupBox, QListWidget, QListWidgetItem,
             QFileDialog, QMessageBox, QTabWidget, QProgressBar, QSplitter,
-            QTableWidget, QTableWidgetItem, QHeaderView, QDialog, QDialogButtonBox
+            QTableWidget, QTableWidgetItem, QHeaderView, QDialog, QDialogButtonBox, QMenu,
+            QProgressDialog
         )
-        from PySide2.QtCore import Qt, Signal, QTimer, QSize
+        from PySide2.QtCore import Qt, Signal, QTimer, QSize, QObject, QRunnable, QThreadPool, QSignalBlocker, QSettings
         from PySide2.QtGui import QIcon, QFont, QColor
         PYSIDE_VERSION = 2
         print("Using PySide2")
@@ -72,10 +78,7 @@ try:
         # New unified convenience functions (safe variants for UI)
         safe_animate_poses,
         safe_create_driver,
-        safe_register_control_to_driver,
-        safe_register_selected_to_driver,
         safe_save_pose,
-        safe_load_poses,
     )
     # Additional check: verify we're actually in Maya
     try:
@@ -104,6 +107,64 @@ except ImportError as e:
     class PoseDataError(FacialAnimatorError): pass
 
 
+def _ui_safe(title: str):
+    """
+    Decorator reporting unexpected errors raised by a UI slot.
+    
+    The error is shown in a critical message box, logged and flagged in the status bar.
+    
+    Args:
+        title: Message prefix, e.g. "Failed to apply settings"
+    """
+    def decorator(fn):
+        # Qt passes signal arguments (e.g. clicked's checked flag) to slots that accept
+        # them, so only forward as many positional arguments as the slot declares
+        arg_count = fn.__code__.co_argcount - 1
+        
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args[:arg_count], **kwargs)
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"{title}: {e}")
+                self.log_message(f"ERROR: {title}: {e}")
+                self.statusBar().showMessage("Error occurred", 3000)
+        return wrapper
+    return decorator
+
+
+# Transform limit query types understood by FacialPoseAnimator.update_limit_type_map
+_VALID_LIMIT_QUERIES = frozenset({'tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz'})
+
+
+class _IOTaskSignals(QObject):
+    """Signals used by _IOTask to hand results back to the main thread."""
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class _IOTask(QRunnable):
+    """
+    Run a blocking callable on the global QThreadPool.
+    
+    Only pure file/JSON work may be run this way - Maya's API is not thread-safe,
+    so anything touching the scene must stay on the main thread.
+    """
+    
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _IOTaskSignals()
+    
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 class PoseInfoDialog(QDialog):
     """Dialog for displaying detailed pose information."""
     
@@ -168,6 +229,15 @@ class PoseInfoDialog(QDialog):
 class FacialPoseCreatorUI(QMainWindow):
     """Main UI window for the Facial Pose Creator."""
     
+    # Skip custom directory icons and symlink resolution, which stat every entry
+    # and can stall the poses file dialogs on network drives
+    POSES_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+    
+    # Prototype cells cloned when adding blank table rows
+    _PROTO_EMPTY = QTableWidgetItem("")
+    _PROTO_ZERO = QTableWidgetItem("0.0")
+    _PROTO_ONE = QTableWidgetItem("1.0")
+    
     def __init__(self, parent=None):
         super().__init__()
         mayaMainWindow = QApplication.instance().activeWindow()
@@ -195,6 +265,16 @@ class FacialPoseCreatorUI(QMainWindow):
         
         self.animator = None
         
+        # Persistent UI preferences (e.g. last used poses directory)
+        self._settings = QSettings("FacialPoseCreator", "UI")
+        
+        # Log messages are queued and flushed to the log widget in batches
+        self._log_queue = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         self.init_animator()
         self.init_ui()
         
@@ -213,6 +293,25 @@ class FacialPoseCreatorUI(QMainWindow):
         else:
             self.animator = None
             print("Running in standalone mode without Maya integration.")
+        
+        self._caps = self._detect_animator_caps()
+    
+    def _detect_animator_caps(self) -> Dict[str, bool]:
+        """
+        Detect which optional animator features are available.
+        
+        Older animator versions (e.g. before a module reload) may lack some methods,
+        so this is checked once when the animator is bound instead of on every use.
+        """
+        def has(name):
+            return callable(getattr(self.animator, name, None))
+        
+        return {
+            'limit_map': has('update_limit_type_map'),
+            'limit_map_dict': has('get_limit_type_map_as_dict'),
+            'custom_limits': has('clear_custom_limits') and has('set_custom_limit'),
+            'custom_limits_dict': has('get_all_custom_limits'),
+        }
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -287,19 +386,15 @@ class FacialPoseCreatorUI(QMainWindow):
             self.excluded_nodes_edit.setPlainText('\n'.join(self.animator.excluded_nodes))
             
             # Load excluded attributes
-            self.excluded_attrs_edit.setPlainText('\n'.join(self.animator.excluded_attributes))
+            self.excluded_attrs_edit.setPlainText('\n'.join(sorted(self.animator.excluded_attributes)))
             
             # Load limit type map from animator
             self.limits_table.setRowCount(0)  # Clear existing rows
             
             # Check if the method exists (for backward compatibility with older animator versions)
-            if hasattr(self.animator, 'get_limit_type_map_as_dict'):
+            if self._caps['limit_map_dict']:
                 limit_mappings = self.animator.get_limit_type_map_as_dict()
-                for attr_name, query_type in limit_mappings.items():
-                    row = self.limits_table.rowCount()
-                    self.limits_table.insertRow(row)
-                    self.limits_table.setItem(row, 0, QTableWidgetItem(attr_name))
-                    self.limits_table.setItem(row, 1, QTableWidgetItem(query_type))
+                self.add_limit_mappings(list(limit_mappings.items()))
             else:
                 # Fallback: manually extract from limit_type_map if method doesn't exist
                 self.log_message("Note: Using older animator version. Please reload the module for full functionality.")
@@ -309,24 +404,20 @@ class FacialPoseCreatorUI(QMainWindow):
                         'rotateX': 'rx', 'rotateY': 'ry', 'rotateZ': 'rz',
                         'scaleX': 'sx', 'scaleY': 'sy', 'scaleZ': 'sz'
                     }
-                    for attr_name in self.animator.limit_type_map.keys():
-                        row = self.limits_table.rowCount()
-                        self.limits_table.insertRow(row)
-                        query_type = query_type_map.get(attr_name, 'tx')
-                        self.limits_table.setItem(row, 0, QTableWidgetItem(attr_name))
-                        self.limits_table.setItem(row, 1, QTableWidgetItem(query_type))
+                    self.add_limit_mappings([
+                        (attr_name, query_type_map.get(attr_name, 'tx'))
+                        for attr_name in self.animator.limit_type_map.keys()
+                    ])
             
             # Load custom limit overrides
             self.custom_limits_table.setRowCount(0)  # Clear existing rows
             
-            if hasattr(self.animator, 'get_all_custom_limits'):
+            if self._caps['custom_limits_dict']:
                 custom_limits = self.animator.get_all_custom_limits()
-                for attr_name, (min_val, max_val) in custom_limits.items():
-                    row = self.custom_limits_table.rowCount()
-                    self.custom_limits_table.insertRow(row)
-                    self.custom_limits_table.setItem(row, 0, QTableWidgetItem(attr_name))
-                    self.custom_limits_table.setItem(row, 1, QTableWidgetItem(str(min_val)))
-                    self.custom_limits_table.setItem(row, 2, QTableWidgetItem(str(max_val)))
+                self.add_custom_limits([
+                    (attr_name, str(min_val), str(max_val))
+                    for attr_name, (min_val, max_val) in custom_limits.items()
+                ])
             
             self.log_message("Loaded current settings from animator.")
             
@@ -750,12 +841,11 @@ class FacialPoseCreatorUI(QMainWindow):
             ("translateY", "ty"),
             ("translateZ", "tz")
         ]
+        self.add_limit_mappings(default_limits)
         
-        for attr, query_type in default_limits:
-            row = self.limits_table.rowCount()
-            self.limits_table.insertRow(row)
-            self.limits_table.setItem(row, 0, QTableWidgetItem(attr))
-            self.limits_table.setItem(row, 1, QTableWidgetItem(query_type))
+        # Context menu for pasting tab-separated rows from the clipboard
+        self.limits_table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.limits_table.customContextMenuRequested.connect(self.show_limits_table_menu)
         
         limits_layout.addWidget(self.limits_table)
         
@@ -797,6 +887,8 @@ class FacialPoseCreatorUI(QMainWindow):
             "Set custom limit ranges for attributes.\n"
             "Example: 'translateX' with min=-10.0, max=10.0"
         )
+        self.custom_limits_table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.custom_limits_table.customContextMenuRequested.connect(self.show_custom_limits_table_menu)
         custom_limits_layout.addWidget(self.custom_limits_table)
         
         # Buttons for managing custom limits
@@ -831,8 +923,18 @@ class FacialPoseCreatorUI(QMainWindow):
     # Event handlers
     
     def log_message(self, message: str):
-        """Add a message to the log."""
-        self.log_text.append(message)
+        """Queue a message for the log; queued messages are flushed together."""
+        self._log_queue.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append all queued log messages in a single update."""
+        if not self._log_queue:
+            return
+        messages = list(self._log_queue)
+        self._log_queue.clear()
+        self.log_text.append('\n'.join(messages))
         self.log_text.verticalScrollBar().setValue(
             self.log_text.verticalScrollBar().maximum()
         )
@@ -1329,10 +1431,16 @@ class FacialPoseCreatorUI(QMainWindow):
     def browse_poses_file(self):
         """Browse for a poses file."""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Poses File", "", "JSON Files (*.json);;All Files (*)"
+            self, "Select Poses File", self._last_poses_dir(), "JSON Files (*.json);;All Files (*)",
+            options=self.POSES_DIALOG_OPTIONS
         )
         if file_path:
             self.poses_file_edit.setText(file_path)
+            self._settings.setValue("last_poses_dir", os.path.dirname(file_path))
+    
+    def _last_poses_dir(self) -> str:
+        """Return the directory the poses file dialogs should open in."""
+        return self._settings.value("last_poses_dir", os.path.expanduser("~"))
     
     def load_poses_from_file(self):
         """Load poses from a file using the new unified API."""
@@ -1345,27 +1453,62 @@ class FacialPoseCreatorUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a file.")
             return
         
+        self.load_poses_btn.setEnabled(False)
+        self.statusBar().showMessage("Loading poses...")
+        
+        # Reading and parsing the file is pure file/JSON work, so keep it off the main thread
+        self._start_io_task(
+            lambda: (file_path, self.animator.read_pose_file(file_path)),
+            self._on_load_poses_done,
+            self._on_load_poses_failed
+        )
+    
+    def _on_load_poses_done(self, outcome):
+        """Import poses parsed by a background load, showing progress as they are added."""
+        file_path, import_data = outcome
+        
+        progress = QProgressDialog("Loading poses...", "Cancel", 0, 100, self)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        
+        loaded = []
         try:
-            # Use the new safe_load_poses function which handles errors gracefully
-            result = safe_load_poses(
-                file_path=file_path,
-                overwrite_existing=True  # UI typically wants to overwrite
-            )
-            
-            if result:
-                self.log_message(f"Loaded {len(result)} poses from: {file_path}")
-                self.refresh_poses_list()
-                QMessageBox.information(self, "Success", f"Loaded {len(result)} poses from file.")
-            else:
-                # safe_load_poses returns None on error
-                self.log_message(f"Failed to load poses from: {file_path}")
-                QMessageBox.warning(self, "Warning", "No poses could be loaded from file.")
-                
-        except Exception as e:
-            # Catch any unexpected errors
-            QMessageBox.critical(self, "Error", f"Failed to load poses: {str(e)}")
+            for index, total, pose_name in self.animator.iter_import_poses(
+                import_data, overwrite_existing=True  # UI typically wants to overwrite
+            ):
+                if pose_name:
+                    loaded.append(pose_name)
+                if index % 16 == 0 or index == total:
+                    progress.setValue(index * 100 // total)
+                    QApplication.processEvents()
+                    if progress.wasCanceled():
+                        self.log_message(f"Loading cancelled after {index}/{total} poses.")
+                        break
+        except PoseDataError as e:
             self.log_message(f"ERROR: {str(e)}")
+        finally:
+            progress.close()
+            self.statusBar().showMessage("Ready")
+            # processEvents() above keeps the UI live, so only allow another load now
+            self.load_poses_btn.setEnabled(True)
+        
+        if loaded:
+            self.animator.pose_storage_file = file_path
+            self.log_message(f"Loaded {len(loaded)} poses from: {file_path}")
+            self.refresh_poses_list()
+            QMessageBox.information(self, "Success", f"Loaded {len(loaded)} poses from file.")
+        else:
+            self.log_message(f"Failed to load poses from: {file_path}")
+            QMessageBox.warning(self, "Warning", "No poses could be loaded from file.")
+    
+    def _on_load_poses_failed(self, error: str):
+        """Handle an unexpected error from a background pose load."""
+        self.load_poses_btn.setEnabled(True)
+        self.statusBar().showMessage("Ready")
+        QMessageBox.critical(self, "Error", f"Failed to load poses: {error}")
+        self.log_message(f"ERROR: {error}")
     
+    @_ui_safe("Failed to save poses")
     def save_poses_to_file(self):
         """Save poses to a file."""
         if not self.animator:
@@ -1375,115 +1518,147 @@ class FacialPoseCreatorUI(QMainWindow):
         file_path = self.poses_file_edit.text()
         if not file_path:
             file_path, _ = QFileDialog.getSaveFileName(
-                self, "Save Poses File", "", "JSON Files (*.json);;All Files (*)"
+                self, "Save Poses File", self._last_poses_dir(), "JSON Files (*.json);;All Files (*)",
+                options=self.POSES_DIALOG_OPTIONS
             )
             if file_path:
                 self.poses_file_edit.setText(file_path)
+                self._settings.setValue("last_poses_dir", os.path.dirname(file_path))
         
         if not file_path:
             return
         
-        try:
-            self.animator.export_poses_to_file(file_path)
-            self.log_message(f"Saved poses to: {file_path}")
-            QMessageBox.information(self, "Success", f"Saved {len(self.animator.saved_poses)} poses to file.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save poses: {str(e)}")
-            self.log_message(f"ERROR: {str(e)}")
+        # Building the export data queries Maya, so it has to happen on the main thread
+        export_data = self.animator.build_poses_export_data()
+        
+        def write_poses():
+            self.animator.write_poses_export_data(file_path, export_data)
+            return file_path, len(export_data['poses'])
+        
+        self.save_poses_btn.setEnabled(False)
+        self.statusBar().showMessage("Saving poses...")
+        self._start_io_task(write_poses, self._on_save_poses_done, self._on_save_poses_failed)
+    
+    def _on_save_poses_done(self, outcome):
+        """Handle completion of a background pose save."""
+        file_path, pose_count = outcome
+        self.save_poses_btn.setEnabled(True)
+        self.statusBar().showMessage("Ready")
+        self.log_message(f"Saved poses to: {file_path}")
+        QMessageBox.information(self, "Success", f"Saved {pose_count} poses to file.")
+    
+    def _on_save_poses_failed(self, error: str):
+        """Handle an error from a background pose save."""
+        self.save_poses_btn.setEnabled(True)
+        self.statusBar().showMessage("Ready")
+        QMessageBox.critical(self, "Error", f"Failed to save poses: {error}")
+        self.log_message(f"ERROR: {error}")
+    
+    def _start_io_task(self, fn, on_finished, on_failed):
+        """
+        Run fn on the global thread pool and deliver the outcome to the given slots.
+        
+        Args:
+            fn: Callable doing pure file/JSON work (no Maya calls)
+            on_finished: Slot receiving fn's return value
+            on_failed: Slot receiving the error message if fn raises
+        """
+        task = _IOTask(fn)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        QThreadPool.globalInstance().start(task)
+        return task
     
+    @_ui_safe("Failed to get driver info")
     def get_driver_info(self):
         """Get information about the driver node."""
         if not self.animator:
             QMessageBox.warning(self, "Error", "Animator not initialized.")
             return
         
-        try:
-            info = self.animator.get_driver_metadata_info()
-            
-            info_text = f"Driver Node: {info.get('driver_node', 'N/A')}\n"
-            info_text += f"Exists: {info.get('exists', False)}\n"
-            info_text += f"Connected Controls: {info.get('connected_controls_count', 0)}\n"
-            info_text += f"Pose Attributes: {info.get('pose_attributes_count', 0)}\n\n"
-            
-            if info.get('connected_controls'):
-                info_text += "Connected Controls:\n"
-                for control in info['connected_controls']:
-                    info_text += f"  - {control}\n"
-            
-            self.driver_info_text.setPlainText(info_text)
-            self.log_message("Retrieved driver information.")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to get driver info: {str(e)}")
-            self.log_message(f"ERROR: {str(e)}")
+        info = self.animator.get_driver_metadata_info()
+        
+        parts = [
+            f"Driver Node: {info.get('driver_node', 'N/A')}",
+            f"Exists: {info.get('exists', False)}",
+            f"Connected Controls: {info.get('connected_controls_count', 0)}",
+            f"Pose Attributes: {info.get('pose_attributes_count', 0)}",
+            "",
+        ]
+        
+        connected_controls = info.get('connected_controls') or []
+        if connected_controls:
+            parts.append("Connected Controls:")
+            parts.extend(f"  - {control}" for control in connected_controls)
+        
+        self.driver_info_text.setPlainText("\n".join(parts))
+        self.log_message("Retrieved driver information.")
     
+    @_ui_safe("Failed to refresh attributes")
     def refresh_driver_attributes(self):
         """Refresh the list of driver attributes."""
         if not self.animator:
             return
         
+        info = self.animator.get_driver_metadata_info()
+        attrs = info.get('pose_attributes', [])
+        
+        # Repopulate in one batch so the list only relayouts once
+        self.driver_attrs_list.setUpdatesEnabled(False)
         try:
-            info = self.animator.get_driver_metadata_info()
-            self.driver_attrs_list.clear()
-            
-            for attr in info.get('pose_attributes', []):
-                self.driver_attrs_list.addItem(attr)
-            
-            self.log_message(f"Refreshed driver attributes: {len(info.get('pose_attributes', []))} attributes.")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to refresh attributes: {str(e)}")
-            self.log_message(f"ERROR: {str(e)}")
+            with QSignalBlocker(self.driver_attrs_list):
+                self.driver_attrs_list.clear()
+                self.driver_attrs_list.addItems(attrs)
+        finally:
+            self.driver_attrs_list.setUpdatesEnabled(True)
+        
+        self.log_message(f"Refreshed driver attributes: {len(attrs)} attributes.")
     
+    @_ui_safe("Error registering items")
     def register_selected_control_to_driver(self):
         """Register the currently selected controls or object sets to the driver node."""
         if not MAYA_AVAILABLE or not self.animator:
             QMessageBox.warning(self, "Error", "Maya/Animator not available.")
             return
         
-        try:
-            self.log_message("Registering selected items to driver...")
-            self.statusBar().showMessage("Registering items...")
+        self.log_message("Registering selected items to driver...")
+        self.statusBar().showMessage("Registering items...")
+        
+        # Use the new unified safe function (imported here, it is only needed for this action)
+        from .facial_pose_animator import safe_register_selected_to_driver
+        
+        result = safe_register_selected_to_driver(
+            driver_node_name=self.driver_name_edit.text(),
+            update_metadata=True
+        )
+        
+        if result and result.get('success'):
+            total_controls = result.get('total_controls', 0)
+            registered = result.get('registered_controls', 0)
+            total_poses = result.get('total_poses', 0)
+            object_sets = result.get('object_sets_processed', [])
             
-            # Use the new unified safe function
-            result = safe_register_selected_to_driver(
-                driver_node_name=self.driver_name_edit.text(),
-                update_metadata=True
-            )
+            success_msg = f"Successfully registered {registered}/{total_controls} controls\n"
+            success_msg += f"Created {total_poses} pose attributes"
+            if object_sets:
+                success_msg += f"\nProcessed object sets: {', '.join(object_sets)}"
             
-            if result and result.get('success'):
-                total_controls = result.get('total_controls', 0)
-                registered = result.get('registered_controls', 0)
-                total_poses = result.get('total_poses', 0)
-                object_sets = result.get('object_sets_processed', [])
-                
-                success_msg = f"Successfully registered {registered}/{total_controls} controls\n"
-                success_msg += f"Created {total_poses} pose attributes"
-                if object_sets:
-                    success_msg += f"\nProcessed object sets: {', '.join(object_sets)}"
-                
-                QMessageBox.information(self, "Success", success_msg)
-                self.log_message(f"Registered {registered} controls: {total_poses} poses created")
-                self.statusBar().showMessage("Items registered successfully", 3000)
-                
-                # Refresh the driver status display
-                self.update_driver_status_display()
-                
-                # Refresh driver attributes list
-                self.refresh_driver_attributes()
-            else:
-                errors = result.get('errors', ['Unknown error']) if result else ['No selection or operation failed']
-                error_msg = "Failed to register items:\n" + "\n".join(errors[:5])  # Show first 5 errors
-                
-                QMessageBox.warning(self, "Warning", error_msg)
-                self.log_message(f"Failed to register items: {errors[0]}")
-                self.statusBar().showMessage("Registration failed", 3000)
-                
-        except Exception as e:
-            error_msg = f"Error registering items: {str(e)}"
-            QMessageBox.critical(self, "Error", error_msg)
-            self.log_message(f"ERROR: {error_msg}")
-            self.statusBar().showMessage("Error occurred", 3000)
+            QMessageBox.information(self, "Success", success_msg)
+            self.log_message(f"Registered {registered} controls: {total_poses} poses created")
+            self.statusBar().showMessage("Items registered successfully", 3000)
+            
+            # Refresh the driver status display
+            self.update_driver_status_display()
+            
+            # Refresh driver attributes list
+            self.refresh_driver_attributes()
+        else:
+            errors = result.get('errors', ['Unknown error']) if result else ['No selection or operation failed']
+            error_msg = "Failed to register items:\n" + "\n".join(errors[:5])  # Show first 5 errors
+            
+            QMessageBox.warning(self, "Warning", error_msg)
+            self.log_message(f"Failed to register items: {errors[0]}")
+            self.statusBar().showMessage("Registration failed", 3000)
     
     def test_driver_attribute(self):
         """Test the selected driver attribute."""
@@ -1500,17 +1675,34 @@ class FacialPoseCreatorUI(QMainWindow):
         """Add a new limit mapping row."""
         row = self.limits_table.rowCount()
         self.limits_table.insertRow(row)
-        self.limits_table.setItem(row, 0, QTableWidgetItem(""))
-        self.limits_table.setItem(row, 1, QTableWidgetItem(""))
+        self.limits_table.setItem(row, 0, self._PROTO_EMPTY.clone())
+        self.limits_table.setItem(row, 1, self._PROTO_EMPTY.clone())
         self.log_message("Added new limit mapping row. Enter attribute name and query type (e.g., 'tx', 'ty', 'tz', 'rx', 'ry', 'rz').")
     
+    def add_limit_mappings(self, pairs: List[Tuple[str, str]]):
+        """
+        Append several limit mapping rows at once.
+        
+        Args:
+            pairs: (attribute name, query type) tuples
+        """
+        table = self.limits_table
+        start = table.rowCount()
+        table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(table):
+                table.setRowCount(start + len(pairs))
+                for offset, (attr_name, query_type) in enumerate(pairs):
+                    table.setItem(start + offset, 0, QTableWidgetItem(attr_name))
+                    table.setItem(start + offset, 1, QTableWidgetItem(query_type))
+        finally:
+            table.setUpdatesEnabled(True)
+    
     def remove_limit_mapping(self):
-        """Remove the selected limit mapping row."""
-        current_row = self.limits_table.currentRow()
-        if current_row >= 0:
-            attr_name = self.limits_table.item(current_row, 0).text() if self.limits_table.item(current_row, 0) else ""
-            self.limits_table.removeRow(current_row)
-            self.log_message(f"Removed limit mapping for: {attr_name if attr_name else 'empty row'}")
+        """Remove the selected limit mapping rows."""
+        removed = self._remove_selected_rows(self.limits_table)
+        if removed:
+            self.log_message(f"Removed limit mapping for: {', '.join(name or 'empty row' for name in removed)}")
         else:
             QMessageBox.warning(self, "Warning", "Please select a row to remove.")
     
@@ -1518,21 +1710,104 @@ class FacialPoseCreatorUI(QMainWindow):
         """Add a new custom limit row."""
         row = self.custom_limits_table.rowCount()
         self.custom_limits_table.insertRow(row)
-        self.custom_limits_table.setItem(row, 0, QTableWidgetItem(""))
-        self.custom_limits_table.setItem(row, 1, QTableWidgetItem("0.0"))
-        self.custom_limits_table.setItem(row, 2, QTableWidgetItem("1.0"))
+        self.custom_limits_table.setItem(row, 0, self._PROTO_EMPTY.clone())
+        self.custom_limits_table.setItem(row, 1, self._PROTO_ZERO.clone())
+        self.custom_limits_table.setItem(row, 2, self._PROTO_ONE.clone())
         self.log_message("Added new custom limit row. Enter attribute name, min value, and max value.")
     
+    def add_custom_limits(self, rows: List[Tuple[str, str, str]]):
+        """
+        Append several custom limit rows at once.
+        
+        Args:
+            rows: (attribute name, min value, max value) tuples of cell texts
+        """
+        table = self.custom_limits_table
+        start = table.rowCount()
+        table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(table):
+                table.setRowCount(start + len(rows))
+                for offset, (attr_name, min_text, max_text) in enumerate(rows):
+                    table.setItem(start + offset, 0, QTableWidgetItem(attr_name))
+                    table.setItem(start + offset, 1, QTableWidgetItem(min_text))
+                    table.setItem(start + offset, 2, QTableWidgetItem(max_text))
+        finally:
+            table.setUpdatesEnabled(True)
+    
+    def show_limits_table_menu(self, pos):
+        """Show the context menu for the limit mappings table."""
+        self._show_paste_rows_menu(self.limits_table, pos, 2, self.add_limit_mappings)
+    
+    def show_custom_limits_table_menu(self, pos):
+        """Show the context menu for the custom limits table."""
+        self._show_paste_rows_menu(self.custom_limits_table, pos, 3, self.add_custom_limits)
+    
+    def _show_paste_rows_menu(self, table: QTableWidget, pos, column_count: int, add_rows):
+        """
+        Show a context menu offering to paste tab-separated clipboard rows into a table.
+        
+        Args:
+            table: Table the menu was requested on
+            pos: Menu position in viewport coordinates
+            column_count: Number of columns each pasted row is padded/truncated to
+            add_rows: Bulk add method receiving the parsed rows
+        """
+        menu = QMenu(self)
+        paste_action = menu.addAction("Paste Rows")
+        if menu.exec_(table.viewport().mapToGlobal(pos)) != paste_action:
+            return
+        
+        rows = []
+        for line in QApplication.clipboard().text().splitlines():
+            if not line.strip():
+                continue
+            cells = [cell.strip() for cell in line.split('\t')][:column_count]
+            cells += [""] * (column_count - len(cells))
+            rows.append(tuple(cells))
+        
+        if rows:
+            add_rows(rows)
+            self.log_message(f"Pasted {len(rows)} row(s) from clipboard.")
+        else:
+            self.log_message("Clipboard does not contain any rows to paste.")
+    
     def remove_custom_limit(self):
-        """Remove the selected custom limit row."""
-        current_row = self.custom_limits_table.currentRow()
-        if current_row >= 0:
-            attr_name = self.custom_limits_table.item(current_row, 0).text() if self.custom_limits_table.item(current_row, 0) else ""
-            self.custom_limits_table.removeRow(current_row)
-            self.log_message(f"Removed custom limit for: {attr_name if attr_name else 'empty row'}")
+        """Remove the selected custom limit rows."""
+        removed = self._remove_selected_rows(self.custom_limits_table)
+        if removed:
+            self.log_message(f"Removed custom limit for: {', '.join(name or 'empty row' for name in removed)}")
         else:
             QMessageBox.warning(self, "Warning", "Please select a row to remove.")
     
+    def _remove_selected_rows(self, table: QTableWidget) -> List[str]:
+        """
+        Remove every row that has a selected cell, falling back to the current row.
+        
+        Args:
+            table: Table to remove rows from
+            
+        Returns:
+            List[str]: First-column texts of the removed rows, in table order
+        """
+        rows = {index.row() for index in table.selectionModel().selectedIndexes()}
+        if not rows and table.currentRow() >= 0:
+            rows = {table.currentRow()}
+        
+        removed = []
+        table.setUpdatesEnabled(False)
+        try:
+            # Remove bottom-up so earlier removals don't shift the remaining indices
+            for row in sorted(rows, reverse=True):
+                item = table.item(row, 0)
+                removed.append(item.text() if item else "")
+                table.removeRow(row)
+        finally:
+            table.setUpdatesEnabled(True)
+        
+        removed.reverse()
+        return removed
+    
     def clear_custom_limits(self):
         """Clear all custom limit rows."""
         reply = QMessageBox.question(
@@ -1542,109 +1817,134 @@ class FacialPoseCreatorUI(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.custom_limits_table.setRowCount(0)
+            with QSignalBlocker(self.custom_limits_table):
+                self.custom_limits_table.setRowCount(0)
             self.log_message("Cleared all custom limits from table.")
     
+    def _snapshot_table(self, table: QTableWidget, cols: int) -> List[Tuple[str, ...]]:
+        """
+        Read a table's cell texts in one pass through its model.
+        
+        Args:
+            table: Table widget to read
+            cols: Number of leading columns to read
+            
+        Returns:
+            List[Tuple[str, ...]]: One tuple of cell texts per row ("" for empty cells)
+        """
+        model = table.model()
+        return [
+            tuple((model.index(row, col).data() or "") for col in range(cols))
+            for row in range(table.rowCount())
+        ]
+    
+    @_ui_safe("Failed to apply settings")
     def apply_settings(self):
         """Apply the current settings to the animator."""
         if not self.animator:
             QMessageBox.warning(self, "Error", "Animator not initialized.")
             return
         
-        try:
-            # Update tolerance
-            self.animator.tolerance = self.tolerance_spinbox.value()
-            
-            # Update undo tracking
-            self.animator.set_undo_tracking(self.undo_tracking_check.isChecked())
-            
-            # Update excluded nodes
-            excluded_nodes = [
-                node.strip() for node in self.excluded_nodes_edit.toPlainText().split('\n')
-                if node.strip()
-            ]
+        # Update tolerance
+        self.animator.tolerance = self.tolerance_spinbox.value()
+        
+        # Update undo tracking
+        self.animator.set_undo_tracking(self.undo_tracking_check.isChecked())
+        
+        # Update excluded nodes, only replacing the animator's list when it differs
+        excluded_nodes = [node for node in map(str.strip, self.excluded_nodes_edit.toPlainText().split('\n')) if node]
+        if list(self.animator.excluded_nodes) != excluded_nodes:
             self.animator.excluded_nodes = excluded_nodes
-            
-            # Update excluded attributes
-            excluded_attrs = [
-                attr.strip() for attr in self.excluded_attrs_edit.toPlainText().split('\n')
-                if attr.strip()
-            ]
+        
+        # Update excluded attributes, likewise compared with the animator's current set
+        excluded_attrs = frozenset(
+            attr for attr in map(str.strip, self.excluded_attrs_edit.toPlainText().split('\n')) if attr
+        )
+        if frozenset(self.animator.excluded_attributes) != excluded_attrs:
             self.animator.excluded_attributes = excluded_attrs
+        
+        # Update transform limit type map
+        limit_mappings = {}
+        
+        for attr_name, query_type in self._snapshot_table(self.limits_table, 2):
+            attr_name = attr_name.strip()
+            query_type = query_type.strip()
             
-            # Update transform limit type map
-            limit_mappings = {}
+            if attr_name and query_type:
+                limit_mappings[attr_name] = query_type
+        
+        # Reject unknown query types here rather than round-tripping them through the animator
+        invalid_queries = [attr for attr, query in limit_mappings.items() if query not in _VALID_LIMIT_QUERIES]
+        for attr in invalid_queries:
+            del limit_mappings[attr]
+        if invalid_queries:
+            self.log_message(f"WARNING: Invalid query types for: {', '.join(invalid_queries)}")
+        
+        # Use the animator's method to update the limit type map if available
+        if self._caps['limit_map']:
+            results = self.animator.update_limit_type_map(limit_mappings)
             
-            for row in range(self.limits_table.rowCount()):
-                attr_item = self.limits_table.item(row, 0)
-                query_item = self.limits_table.item(row, 1)
-                
-                if attr_item and query_item:
-                    attr_name = attr_item.text().strip()
-                    query_type = query_item.text().strip()
-                    
-                    if attr_name and query_type:
-                        limit_mappings[attr_name] = query_type
+            # Log results
+            failed_mappings = [attr for attr, success in results.items() if not success]
+            if failed_mappings:
+                self.log_message(f"WARNING: Invalid mappings for: {', '.join(failed_mappings)}")
             
-            # Use the animator's method to update the limit type map if available
-            if hasattr(self.animator, 'update_limit_type_map'):
-                results = self.animator.update_limit_type_map(limit_mappings)
-                
-                # Log results
-                failed_mappings = [attr for attr, success in results.items() if not success]
-                if failed_mappings:
-                    self.log_message(f"WARNING: Invalid mappings for: {', '.join(failed_mappings)}")
-                
-                success_count = sum(1 for success in results.values() if success)
-                self.log_message(f"Updated limit type map with {success_count} mappings.")
-            else:
-                # Fallback: directly update the limit_type_map (older version)
-                self.log_message("Note: Using older animator version. Please reload the module for full functionality.")
-                # We can't easily update lambdas without the helper method, so just log a warning
-                self.log_message("WARNING: Limit type map updates require reloading the facial_pose_animator module.")
+            success_count = sum(1 for success in results.values() if success)
+            self.log_message(f"Updated limit type map with {success_count} mappings.")
+        else:
+            # Fallback: directly update the limit_type_map (older version)
+            self.log_message("Note: Using older animator version. Please reload the module for full functionality.")
+            # We can't easily update lambdas without the helper method, so just log a warning
+            self.log_message("WARNING: Limit type map updates require reloading the facial_pose_animator module.")
+        
+        # Update custom limit overrides (if available)
+        if self._caps['custom_limits']:
+            self.animator.clear_custom_limits()
+            custom_limits_count = 0
+            custom_limits_errors = []
             
-            # Update custom limit overrides (if available)
-            if hasattr(self.animator, 'clear_custom_limits') and hasattr(self.animator, 'set_custom_limit'):
-                self.animator.clear_custom_limits()
-                custom_limits_count = 0
-                custom_limits_errors = []
-                
-                for row in range(self.custom_limits_table.rowCount()):
-                    attr_item = self.custom_limits_table.item(row, 0)
-                    min_item = self.custom_limits_table.item(row, 1)
-                    max_item = self.custom_limits_table.item(row, 2)
-                    
-                    if attr_item and min_item and max_item:
-                        attr_name = attr_item.text().strip()
-                        
-                        if attr_name:
-                            try:
-                                min_value = float(min_item.text().strip())
-                                max_value = float(max_item.text().strip())
-                                
-                                self.animator.set_custom_limit(attr_name, min_value, max_value)
-                                custom_limits_count += 1
-                            except ValueError as ve:
-                                custom_limits_errors.append(f"{attr_name}: {str(ve)}")
-                
-                if custom_limits_count > 0:
-                    self.log_message(f"Applied {custom_limits_count} custom limit override(s).")
-                
-                if custom_limits_errors:
-                    error_msg = "Custom limit errors:\n" + "\n".join(custom_limits_errors)
-                    self.log_message(f"WARNING: {error_msg}")
-                    QMessageBox.warning(self, "Custom Limit Errors", error_msg)
-            else:
-                # Custom limits feature not available
-                if self.custom_limits_table.rowCount() > 0:
-                    self.log_message("WARNING: Custom limits feature requires reloading the facial_pose_animator module.")
+            custom_rows = [
+                (attr_name.strip(), min_text.strip(), max_text.strip())
+                for attr_name, min_text, max_text in self._snapshot_table(self.custom_limits_table, 3)
+                if attr_name.strip()
+            ]
             
-            self.log_message("Settings applied successfully.")
-            QMessageBox.information(self, "Success", "Settings applied successfully.")
+            try:
+                # Common case: every row parses, so convert them all in one pass
+                parsed_limits = [
+                    (attr_name, float(min_text), float(max_text))
+                    for attr_name, min_text, max_text in custom_rows
+                ]
+            except ValueError:
+                # Re-parse row by row only to report which rows are invalid
+                parsed_limits = []
+                for attr_name, min_text, max_text in custom_rows:
+                    try:
+                        parsed_limits.append((attr_name, float(min_text), float(max_text)))
+                    except ValueError as ve:
+                        custom_limits_errors.append(f"{attr_name}: {str(ve)}")
             
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to apply settings: {str(e)}")
-            self.log_message(f"ERROR: {str(e)}")
+            for attr_name, min_value, max_value in parsed_limits:
+                try:
+                    self.animator.set_custom_limit(attr_name, min_value, max_value)
+                    custom_limits_count += 1
+                except ValueError as ve:
+                    custom_limits_errors.append(f"{attr_name}: {str(ve)}")
+            
+            if custom_limits_count > 0:
+                self.log_message(f"Applied {custom_limits_count} custom limit override(s).")
+            
+            if custom_limits_errors:
+                error_msg = "Custom limit errors:\n" + "\n".join(custom_limits_errors)
+                self.log_message(f"WARNING: {error_msg}")
+                QMessageBox.warning(self, "Custom Limit Errors", error_msg)
+        else:
+            # Custom limits feature not available
+            if self.custom_limits_table.rowCount() > 0:
+                self.log_message("WARNING: Custom limits feature requires reloading the facial_pose_animator module.")
+        
+        self.log_message("Settings applied successfully.")
+        QMessageBox.information(self, "Success", "Settings applied successfully.")
 
 
 def show_ui():
@@ -14,32 +14,88 @@ Usage in Maya Script Editor:
     reload_all()
 """
 
+import os
 import sys
 import importlib
 
 
-def reload_all():
-    """Reload all Facial Pose Creator modules."""
-    
-    # Order matters: reload base modules before UI
-    modules_to_reload = [
+# Package modules mapped to the package modules they import; a module is
+# reloaded after its dependencies so it re-binds their fresh definitions
+_RELOAD_DEPS = {
+    'src.facialposecreator.facial_pose_animator': [],
+    'src.facialposecreator.facial_pose_creator': ['src.facialposecreator.facial_pose_animator'],
+    'src.facialposecreator': [
         'src.facialposecreator.facial_pose_animator',
         'src.facialposecreator.facial_pose_creator',
-        'src.facialposecreator'
-    ]
+    ],
+}
+
+# Last reloaded source mtime per module name, used to skip unchanged files
+_mtime_cache = {}
+
+
+def _reload_order():
+    """Return the modules in _RELOAD_DEPS ordered so dependencies come first."""
+    try:
+        from graphlib import TopologicalSorter
+    except ImportError:  # Python < 3.9
+        order = []
+        
+        def visit(module_name):
+            if module_name not in order:
+                for dependency in _RELOAD_DEPS[module_name]:
+                    visit(dependency)
+                order.append(module_name)
+        
+        for module_name in _RELOAD_DEPS:
+            visit(module_name)
+        return order
+    
+    return list(TopologicalSorter(_RELOAD_DEPS).static_order())
+
+
+def reload_all(force=False):
+    """
+    Reload all Facial Pose Creator modules.
+    
+    Modules are reloaded in dependency order. Modules whose source file has not
+    changed since the last reload are skipped, unless one of their dependencies
+    was reloaded (they must then be reloaded to pick up the new bindings).
+    
+    Args:
+        force: Reload every loaded module regardless of file modification times
+    """
+    
+    # Pick up files added since the import system last scanned the package
+    importlib.invalidate_caches()
     
     print("=" * 60)
     print("Reloading Facial Pose Creator Modules")
     print("=" * 60)
     
     reloaded_count = 0
+    unchanged_count = 0
     not_loaded_count = 0
     failed_count = 0
     
-    for module_name in modules_to_reload:
+    reloaded_modules = set()
+    
+    for module_name in _reload_order():
         if module_name in sys.modules:
+            module = sys.modules[module_name]
+            path = getattr(module, '__file__', None)
+            mtime = os.path.getmtime(path) if path and os.path.exists(path) else 0
+            
+            dependency_reloaded = any(dep in reloaded_modules for dep in _RELOAD_DEPS[module_name])
+            if not force and not dependency_reloaded and _mtime_cache.get(module_name) == mtime:
+                print(f"= Unchanged: {module_name}")
+                unchanged_count += 1
+                continue
+            
             try:
-                importlib.reload(sys.modules[module_name])
+                importlib.reload(module)
+                _mtime_cache[module_name] = mtime
+                reloaded_modules.add(module_name)
                 print(f"✓ Reloaded: {module_name}")
                 reloaded_count += 1
             except Exception as e:
@@ -52,7 +108,7 @@ def reload_all():
             not_loaded_count += 1
     
     print("=" * 60)
-    print(f"Reload complete! (✓ {reloaded_count} | ○ {not_loaded_count} | ✗ {failed_count})")
+    print(f"Reload complete! (✓ {reloaded_count} | = {unchanged_count} | ○ {not_loaded_count} | ✗ {failed_count})")
     print("=" * 60)
     
     if reloaded_count > 0:
@@ -60,6 +116,8 @@ def reload_all():
         print("\nTo show the UI, run:")
         print("    from src.facialposecreator import facial_pose_creator")
         print("    facial_pose_creator.show_ui()")
+    elif unchanged_count > 0:
+        print("\n= No changes detected. Use reload_all(force=True) to reload anyway.")
     elif not_loaded_count > 0:
         print("\n○ No modules were loaded yet. Import them first:")
         print("    from src.facialposecreator import facial_pose_creator")
@@ -70,6 +128,7 @@ def reload_all():
     
     return {
         'reloaded': reloaded_count,
+        'unchanged': unchanged_count,
         'not_loaded': not_loaded_count,
         'failed': failed_count
     }
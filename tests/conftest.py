@@ -0,0 +1,76 @@
+"""
+Shared pytest configuration for the facial pose test suite.
+
+Runs once per session, before the test modules are collected.
+"""
+
+import os
+import sys
+
+# Add the tests directory to sys.path so test modules can import each other
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if _TESTS_DIR not in sys.path:
+    sys.path.insert(0, _TESTS_DIR)
+
+
+# True when this process started Maya in pytest_configure and must shut it down
+_OWNS_MAYA = False
+
+
+def _maya_running() -> bool:
+    """Return True if Maya is already initialized in this process."""
+    try:
+        import maya.cmds as cmds
+        cmds.about(version=True)
+        return True
+    except Exception:
+        return False
+
+
+def _is_xdist_controller(config) -> bool:
+    """Return True for the xdist process that only dispatches tests to workers."""
+    return not hasattr(config, "workerinput") and bool(getattr(config.option, "numprocesses", None))
+
+
+def _pin_xdist_worker() -> None:
+    """
+    Pin this xdist worker to one CPU so Maya's working set stays cache-warm.
+    
+    Worker ``gwN`` gets the N-th CPU this process may run on (wrapping
+    around). Skipped outside xdist, on platforms without sched_setaffinity,
+    and when NO_AFFINITY=1 is set.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    if not worker.startswith("gw") or os.environ.get("NO_AFFINITY") == "1":
+        return
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cpus[int(worker[2:]) % len(cpus)]})
+
+
+def pytest_configure(config):
+    """
+    Initialize Maya standalone once per test process.
+    
+    Under ``pytest -n auto`` every xdist worker is its own process and runs
+    this hook, so each worker gets its own Maya session before collection
+    imports the test modules. The xdist controller never runs tests, so it
+    skips Maya entirely. When pytest is started in-process by a runner that
+    already initialized Maya, the existing session is reused.
+    """
+    global _OWNS_MAYA
+    if _is_xdist_controller(config) or _maya_running():
+        return
+    _pin_xdist_worker()
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    _OWNS_MAYA = True
+
+
+def pytest_unconfigure(config):
+    """Shut down the Maya session started in pytest_configure."""
+    if not _OWNS_MAYA:
+        return
+    import maya.standalone
+    maya.standalone.uninitialize()
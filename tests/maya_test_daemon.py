@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+Persistent Maya test server for fast repeated test runs.
+
+Starts Maya standalone once, then serves test requests over a Unix socket so
+each run of run_container_tests.py skips Maya initialization. The animator
+and test modules are reloaded before every run to pick up code changes.
+
+Usage:
+    # Start the server (keeps running until stopped)
+    mayapy maya_test_daemon.py
+
+    # In another shell, runs are routed to the server automatically
+    mayapy run_container_tests.py TestFacialPoseData
+
+    # Stop the server
+    mayapy maya_test_daemon.py --stop
+
+Protocol: the client sends one JSON request and shuts down its write side;
+the server replies with one JSON document and closes the connection.
+    {"cmd": "run", "names": ["TestFacialPoseData"], "failfast": false}
+    {"cmd": "shutdown"}
+"""
+
+import sys
+import os
+import json
+import socket
+import argparse
+import importlib
+import logging
+
+SOCKET_PATH = os.environ.get("MAYA_TESTD_SOCKET", "/tmp/maya_testd.sock")
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _recv_all(conn):
+    """Read from a socket until the peer shuts down its write side."""
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def send_request(request, timeout=None):
+    """
+    Send a request to a running server and return its decoded response.
+
+    Args:
+        request: JSON-serializable request dictionary
+        timeout: Socket timeout in seconds (None waits indefinitely)
+
+    Returns:
+        dict or None: The response, or None if no server is listening
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(SOCKET_PATH)
+            conn.sendall(json.dumps(request).encode("utf-8"))
+            conn.shutdown(socket.SHUT_WR)
+            return json.loads(_recv_all(conn).decode("utf-8"))
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+
+def _run_tests(names, failfast):
+    """Reload the code under test and run the requested tests."""
+    import facialposecreator.facial_pose_animator as animator_module
+    import test_facial_pose_animator
+
+    importlib.reload(animator_module)
+    test_module = importlib.reload(test_facial_pose_animator)
+
+    result = test_module.FacialPoseAnimatorTestSuite.run(names or None, failfast=failfast)
+    return {
+        "tests_run": result.testsRun,
+        "failures": [[str(test), traceback] for test, traceback in result.failures],
+        "errors": [[str(test), traceback] for test, traceback in result.errors],
+        "success": result.wasSuccessful(),
+    }
+
+
+def serve():
+    """Initialize Maya and serve requests until a shutdown request arrives."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from run_container_tests import setup_maya_environment
+
+    if not setup_maya_environment():
+        logger.error("Failed to initialize Maya environment")
+        return 1
+
+    # A socket file left behind by a crashed server would block bind()
+    if os.path.exists(SOCKET_PATH):
+        os.unlink(SOCKET_PATH)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(SOCKET_PATH)
+    server.listen(1)
+    logger.info(f"Maya test server listening on {SOCKET_PATH}")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    request = json.loads(_recv_all(conn).decode("utf-8"))
+                    if request.get("cmd") == "shutdown":
+                        conn.sendall(b'{"stopped": true}')
+                        break
+                    if request.get("cmd") != "run":
+                        raise ValueError(f"Unknown command: {request.get('cmd')}")
+                    response = _run_tests(request.get("names"), bool(request.get("failfast")))
+                except Exception as e:
+                    logger.error(f"Request failed: {e}")
+                    response = {"error": str(e)}
+                conn.sendall(json.dumps(response).encode("utf-8"))
+    finally:
+        server.close()
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+        logger.info("Maya test server stopped")
+
+    try:
+        import maya.standalone
+        maya.standalone.uninitialize()
+    except Exception:
+        pass
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Persistent Maya server for facial_pose_animator tests')
+    parser.add_argument('--stop', action='store_true', help='Stop a running server')
+    args = parser.parse_args()
+
+    if args.stop:
+        if send_request({"cmd": "shutdown"}, timeout=10) is None:
+            logger.info("No Maya test server is running")
+        return 0
+
+    return serve()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
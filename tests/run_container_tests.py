@@ -8,19 +8,52 @@ import os
 import argparse
 import logging
 
-# Configure logging for container environment
-logging.basicConfig(
-    level=logging.INFO, 
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/app/test_results/test.log', mode='w')
-    ]
-)
+# Write buffer for the log and result files; volume-mounted result
+# directories make every small write an expensive syscall
+_IO_BUFFER_SIZE = 131072
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that lets a large write buffer batch records instead of flushing each one."""
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_IO_BUFFER_SIZE, encoding=self.encoding)
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+def _configure_logging():
+    """
+    Configure logging for the container environment.
+    
+    Called from main() rather than at import, so importing this module (the
+    test server and the test suite do) does not truncate the log file.
+    logging.shutdown() flushes the buffered file handler at interpreter exit.
+    """
+    logging.basicConfig(
+        level=logging.INFO, 
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            BufferedFileHandler('/app/test_results/test.log', mode='w')
+        ]
+    )
+
 logger = logging.getLogger(__name__)
 
+# Set once Maya standalone is initialized and configured in this process
+_MAYA_READY = False
+
 def setup_maya_environment():
     """Initialize Maya for headless operation in container."""
+    global _MAYA_READY
+    if _MAYA_READY:
+        return True
+    
     try:
         import maya.standalone
         maya.standalone.initialize(name='python')
@@ -28,23 +61,187 @@ def setup_maya_environment():
         # Configure Maya for headless operation
         import maya.cmds as cmds
         
-        # Set render globals for faster operation
-        cmds.setAttr("defaultRenderGlobals.imageFormat", 8)  # JPEG
-        cmds.setAttr("defaultRenderGlobals.animation", 0)     # Single frame
+        # Set render globals for faster operation, skipping values already in place
+        if cmds.getAttr("defaultRenderGlobals.imageFormat") != 8:
+            cmds.setAttr("defaultRenderGlobals.imageFormat", 8)  # JPEG
+        if cmds.getAttr("defaultRenderGlobals.animation") != 0:
+            cmds.setAttr("defaultRenderGlobals.animation", 0)     # Single frame
         
         # Disable unnecessary Maya features for testing
-        cmds.optionVar(iv=("suppressFileOpenDialog", 1))
-        cmds.optionVar(iv=("suppressFileSaveDialog", 1))
+        for option_var in ("suppressFileOpenDialog", "suppressFileSaveDialog"):
+            if not cmds.optionVar(exists=option_var) or cmds.optionVar(q=option_var) != 1:
+                cmds.optionVar(iv=(option_var, 1))
         
         logger.info("Maya standalone initialized successfully in container")
+        _MAYA_READY = True
         return True
         
     except Exception as e:
         logger.error(f"Failed to initialize Maya: {e}")
         return False
 
-def run_tests(test_class=None, verbose=False, output_dir="/app/test_results"):
+def _xdist_available():
+    """Return True if pytest and pytest-xdist can be imported."""
+    import importlib.util
+    return all(importlib.util.find_spec(name) is not None for name in ("pytest", "xdist"))
+
+def _use_parallel():
+    """
+    Return True if whole-suite runs should go through pytest-xdist.
+    
+    Sharded runs (TEST_SHARD_COUNT > 1) stay on the unittest path, which
+    selects this container's classes from TEST_SHARD_INDEX.
+    """
+    return int(os.environ.get("TEST_SHARD_COUNT", 1)) <= 1 and _xdist_available()
+
+def run_tests_parallel(verbose=False, output_dir="/app/test_results", failfast=False, quiet=False,
+                       test_class=None, last_failed=False):
+    """
+    Run tests through pytest, across CPU cores when pytest-xdist is installed.
+    
+    With last_failed, pytest's cache (.pytest_cache) narrows the run to the
+    tests that failed last time, or runs everything when none did.
+    """
+    import pytest
+    
+    test_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_facial_pose_animator.py")
+    results_file = os.path.join(output_dir, "results.xml")
+    
+    args = [f"{test_file}::{test_class}" if test_class else test_file, "--junitxml", results_file]
+    if _xdist_available():
+        # loadscope keeps every TestCase class on a single worker so its
+        # setUpClass fixtures and scene state are never split across processes
+        args += ["-n", "auto", "--dist=loadscope"]
+    if last_failed:
+        args.append("--lf")
+    if verbose:
+        args.append("-v")
+    if failfast:
+        args.append("-x")
+    if quiet:
+        args.append("-q")
+    
+    logger.info("Running tests with pytest")
+    exit_code = int(pytest.main(args))
+    logger.info(f"JUnit XML results written to: {results_file}")
+    
+    # Keep test_results.txt in the same format as the in-process runner writes
+    return report_results(_junit_result(results_file, exit_code), output_dir)
+
+def _junit_result(results_file, exit_code):
+    """
+    Build a unittest-style result from a pytest JUnit XML report.
+    
+    Returns:
+        Object with testsRun, failures, errors and wasSuccessful(), as report_results() expects
+    """
+    import xml.etree.ElementTree as ET
+    from types import SimpleNamespace
+    
+    failures, errors, tests_run = [], [], 0
+    try:
+        testcases = ET.parse(results_file).getroot().iter("testcase")
+    except (OSError, ET.ParseError) as e:
+        testcases = ()
+        errors.append(("pytest", f"pytest exited with status {exit_code} without a readable report: {e}"))
+    
+    for case in testcases:
+        tests_run += 1
+        label = f"{case.get('name')} ({case.get('classname')})"
+        for tag, entries in (("failure", failures), ("error", errors)):
+            element = case.find(tag)
+            if element is not None:
+                entries.append((label, element.text or element.get("message", "")))
+    
+    return SimpleNamespace(
+        testsRun=tests_run,
+        failures=failures,
+        errors=errors,
+        wasSuccessful=lambda: exit_code == 0,
+    )
+
+def _test_name(test):
+    """
+    Name a failure or error entry's test.
+    
+    Entries are strings from the pytest and server paths, TestCase objects from
+    the text runner, or xmlrunner _TestInfo objects, which have no __str__.
+    """
+    if isinstance(test, str):
+        return test
+    return getattr(test, "test_id", None) or test.id()
+
+def report_results(result, output_dir="/app/test_results"):
+    """Write the detailed result file, print the summary and return the exit code."""
+    # Write detailed results to file
+    results_file = os.path.join(output_dir, "test_results.txt")
+    parts = [
+        "Maya Container Test Results\n",
+        "=" * 50 + "\n",
+        f"Tests run: {result.testsRun}\n",
+        f"Failures: {len(result.failures)}\n",
+        f"Errors: {len(result.errors)}\n",
+        f"Success: {result.wasSuccessful()}\n\n",
+    ]
+    
+    with open(results_file, 'w', buffering=_IO_BUFFER_SIZE) as f:
+        f.write("".join(parts))
+        
+        # Stream failure and error entries straight into the write buffer
+        for title, entries in (("FAILURES", result.failures), ("ERRORS", result.errors)):
+            if entries:
+                f.write(f"{title}:\n{'-' * 20}\n")
+                f.writelines(f"{i}. {_test_name(test)}\n{traceback}\n\n" for i, (test, traceback) in enumerate(entries, 1))
+    
+    # Print summary to stdout in a single write
+    print("\n".join([
+        "\n" + "=" * 60,
+        "MAYA CONTAINER TEST RESULTS",
+        "=" * 60,
+        f"Tests run: {result.testsRun}",
+        f"Failures: {len(result.failures)}",
+        f"Errors: {len(result.errors)}",
+        f"Success: {result.wasSuccessful()}",
+        f"Results written to: {results_file}",
+    ]), flush=True)
+    
+    return 0 if result.wasSuccessful() else 1
+
+def _run_via_daemon(test_class=None, failfast=False):
+    """
+    Run tests on a persistent Maya test server if one is listening.
+    
+    Returns:
+        The test result, or None when no server is running
+    """
+    from types import SimpleNamespace
+    try:
+        from maya_test_daemon import send_request
+    except ImportError:
+        # Images built without the server script simply run tests in-process
+        return None
+    
+    response = send_request({"cmd": "run", "names": [test_class] if test_class else None, "failfast": failfast})
+    if response is None:
+        return None
+    if "error" in response:
+        raise RuntimeError(f"Maya test server error: {response['error']}")
+    
+    logger.info("Tests ran on the persistent Maya test server")
+    return SimpleNamespace(
+        testsRun=response["tests_run"],
+        failures=response["failures"],
+        errors=response["errors"],
+        wasSuccessful=lambda: response["success"],
+    )
+
+def run_tests(test_class=None, verbose=False, output_dir="/app/test_results", failfast=False, quiet=False):
     """Run the facial pose animator tests."""
+    # Whole-suite runs are spread across workers when xdist is installed;
+    # single-class debugging runs stay in-process where workers cost more than they save
+    if not test_class and _use_parallel():
+        return run_tests_parallel(verbose, output_dir, failfast, quiet)
+    
     try:
         # Import test module
         from test_facial_pose_animator import FacialPoseAnimatorTestSuite
@@ -54,47 +251,10 @@ def run_tests(test_class=None, verbose=False, output_dir="/app/test_results"):
             logger.info(f"Target test class: {test_class}")
         
         # Run tests
-        suite = FacialPoseAnimatorTestSuite()
-        if test_class:
-            result = suite.run_specific_test(test_class)
-        else:
-            result = suite.run_all_tests()
+        result = FacialPoseAnimatorTestSuite.run([test_class] if test_class else None,
+                                                 failfast=failfast, output_dir=output_dir, quiet=quiet)
         
-        # Write detailed results to file
-        results_file = os.path.join(output_dir, "test_results.txt")
-        with open(results_file, 'w') as f:
-            f.write("Maya Container Test Results\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Tests run: {result.testsRun}\n")
-            f.write(f"Failures: {len(result.failures)}\n")
-            f.write(f"Errors: {len(result.errors)}\n")
-            f.write(f"Success: {result.wasSuccessful()}\n\n")
-            
-            if result.failures:
-                f.write("FAILURES:\n")
-                f.write("-" * 20 + "\n")
-                for i, (test, traceback) in enumerate(result.failures, 1):
-                    f.write(f"{i}. {test}\n")
-                    f.write(f"{traceback}\n\n")
-            
-            if result.errors:
-                f.write("ERRORS:\n")
-                f.write("-" * 20 + "\n")
-                for i, (test, traceback) in enumerate(result.errors, 1):
-                    f.write(f"{i}. {test}\n")
-                    f.write(f"{traceback}\n\n")
-        
-        # Print summary to stdout
-        print("\n" + "=" * 60)
-        print("MAYA CONTAINER TEST RESULTS")
-        print("=" * 60)
-        print(f"Tests run: {result.testsRun}")
-        print(f"Failures: {len(result.failures)}")
-        print(f"Errors: {len(result.errors)}")
-        print(f"Success: {result.wasSuccessful()}")
-        print(f"Results written to: {results_file}")
-        
-        return 0 if result.wasSuccessful() else 1
+        return report_results(result, output_dir)
         
     except Exception as e:
         logger.error(f"Error running tests: {e}")
@@ -102,24 +262,99 @@ def run_tests(test_class=None, verbose=False, output_dir="/app/test_results"):
         traceback.print_exc()
         return 1
 
+def collect_test_ids():
+    """
+    List test ids without importing the test module.
+    
+    Importing the module pulls in PyMEL, which starts a Maya session on its
+    own, so the source is walked with ast instead. Ids follow unittest's
+    default loader order (classes and methods sorted by name).
+    """
+    import ast
+    
+    test_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_facial_pose_animator.py")
+    module_name = os.path.splitext(os.path.basename(test_file))[0]
+    with open(test_file, "rb") as f:
+        tree = ast.parse(f.read(), filename=test_file)
+    
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    
+    def base_names(node):
+        return [getattr(base, "attr", getattr(base, "id", None)) for base in node.bases]
+    
+    def is_test_case(name, seen=()):
+        # Follow bases defined in this module (e.g. MayaSceneTestCase) up to TestCase
+        if name == "TestCase":
+            return True
+        node = classes.get(name)
+        if node is None or name in seen:
+            return False
+        return any(is_test_case(base, seen + (name,)) for base in base_names(node))
+    
+    def test_methods(name, seen=()):
+        # Test methods of the class plus those it inherits from classes in this module
+        node = classes.get(name)
+        if node is None or name in seen:
+            return set()
+        methods = {item.name for item in node.body
+                   if isinstance(item, ast.FunctionDef) and item.name.startswith("test")}
+        for base in base_names(node):
+            methods |= test_methods(base, seen + (name,))
+        return methods
+    
+    test_ids = []
+    for name in sorted(classes):
+        if is_test_case(name):
+            test_ids.extend(f"{module_name}.{name}.{method}" for method in sorted(test_methods(name)))
+    return test_ids
+
 def main():
     parser = argparse.ArgumentParser(description='Run facial_pose_animator tests in Maya container')
     parser.add_argument('test_class', nargs='?', help='Specific test class to run')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--output-dir', default='/app/test_results', help='Output directory for test results')
+    parser.add_argument('--failfast', action='store_true', help='Stop at the first failing test')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Suppress per-test progress output; only print the summary')
+    parser.add_argument('--collect-only', action='store_true', help='Print test ids without initializing Maya or running tests')
+    parser.add_argument('--last-failed', '--lf', action='store_true',
+                        help='Rerun only the tests that failed last time (uses pytest\'s cache)')
     
     args = parser.parse_args()
+    _configure_logging()
+    
+    if args.collect_only:
+        print("\n".join(collect_test_ids()))
+        return 0
+    
+    # A running maya_test_daemon.py already holds an initialized Maya session;
+    # it has no record of earlier failures, so --last-failed goes to pytest
+    if not args.last_failed:
+        try:
+            daemon_result = _run_via_daemon(args.test_class, args.failfast)
+        except Exception as e:
+            logger.error(f"Error running tests: {e}")
+            return 1
+        if daemon_result is not None:
+            return report_results(daemon_result, args.output_dir)
     
     print("Facial Pose Animator - Maya Container Test Runner")
     print("=" * 60)
     
+    # Parallel runs initialize Maya inside each xdist worker (see conftest.py),
+    # so the dispatching process does not pay for a session it never uses
+    if args.last_failed:
+        return run_tests_parallel(args.verbose, args.output_dir, args.failfast, args.quiet,
+                                  test_class=args.test_class, last_failed=True)
+    if not args.test_class and _use_parallel():
+        return run_tests_parallel(args.verbose, args.output_dir, args.failfast, args.quiet)
+    
     # Initialize Maya
     if not setup_maya_environment():
         logger.error("Failed to initialize Maya environment")
         return 1
     
     # Run tests
-    exit_code = run_tests(args.test_class, args.verbose, args.output_dir)
+    exit_code = run_tests(args.test_class, args.verbose, args.output_dir, args.failfast, args.quiet)
     
     # Cleanup
     try:
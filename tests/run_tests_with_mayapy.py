@@ -77,14 +77,14 @@ def setup_test_environment():
             
         logger.info(f"Added {current_dir} to Python path")
         
-        # Verify that our test module can be imported
-        try:
-            import test_facial_pose_animator
-            logger.info("Test module imported successfully")
-            return True
-        except ImportError as e:
-            logger.error(f"Failed to import test module: {e}")
+        # Verify that our test module can be found without importing it yet;
+        # importing pulls in PyMEL and the animator, which is deferred until tests run
+        import importlib.util
+        if importlib.util.find_spec("test_facial_pose_animator") is None:
+            logger.error("Failed to find test module: test_facial_pose_animator")
             return False
+        logger.info("Test module found successfully")
+        return True
             
     except Exception as e:
         logger.error(f"Error setting up test environment: {e}")
@@ -114,37 +114,28 @@ def run_tests_with_maya(test_class: Optional[str] = None, verbose: bool = False)
         
         if test_class:
             logger.info(f"Running specific test class: {test_class}")
-            # Run specific test class
-            suite = FacialPoseAnimatorTestSuite()
-            result = suite.run_specific_test(test_class)
         else:
             logger.info("Running all test classes")
-            # Run all tests
-            suite = FacialPoseAnimatorTestSuite()
-            result = suite.run_all_tests()
-        
-        # Print detailed results
-        print("\n" + "=" * 60)
-        print("MAYA ENVIRONMENT TEST RESULTS")
-        print("=" * 60)
-        print(f"Tests run: {result.testsRun}")
-        print(f"Failures: {len(result.failures)}")
-        print(f"Errors: {len(result.errors)}")
-        print(f"Success: {result.wasSuccessful()}")
-        
-        if result.failures:
-            print("\nFAILURES:")
-            for i, (test, traceback) in enumerate(result.failures, 1):
-                print(f"\n{i}. {test}")
-                print("-" * 40)
-                print(traceback)
-                
-        if result.errors:
-            print("\nERRORS:")
-            for i, (test, traceback) in enumerate(result.errors, 1):
-                print(f"\n{i}. {test}")
-                print("-" * 40)
-                print(traceback)
+        result = FacialPoseAnimatorTestSuite.run([test_class] if test_class else None)
+        
+        # Print detailed results in a single write
+        lines = [
+            "\n" + "=" * 60,
+            "MAYA ENVIRONMENT TEST RESULTS",
+            "=" * 60,
+            f"Tests run: {result.testsRun}",
+            f"Failures: {len(result.failures)}",
+            f"Errors: {len(result.errors)}",
+            f"Success: {result.wasSuccessful()}",
+        ]
+        
+        for title, entries in (("FAILURES", result.failures), ("ERRORS", result.errors)):
+            if entries:
+                lines.append(f"\n{title}:")
+                for i, (test, traceback) in enumerate(entries, 1):
+                    lines.extend([f"\n{i}. {test}", "-" * 40, traceback])
+        
+        print("\n".join(lines), flush=True)
         
         return 0 if result.wasSuccessful() else 1
         
@@ -175,21 +166,20 @@ def run_tests_without_maya(test_class: Optional[str] = None, verbose: bool = Fal
         
         if test_class:
             logger.info(f"Running specific test class: {test_class}")
-            suite = FacialPoseAnimatorTestSuite()
-            result = suite.run_specific_test(test_class)
         else:
             logger.info("Running all test classes")
-            suite = FacialPoseAnimatorTestSuite()
-            result = suite.run_all_tests()
-        
-        # Print results
-        print("\n" + "=" * 60)
-        print("MOCK ENVIRONMENT TEST RESULTS")
-        print("=" * 60)
-        print(f"Tests run: {result.testsRun}")
-        print(f"Failures: {len(result.failures)}")
-        print(f"Errors: {len(result.errors)}")
-        print(f"Success: {result.wasSuccessful()}")
+        result = FacialPoseAnimatorTestSuite.run([test_class] if test_class else None)
+        
+        # Print results in a single write
+        print("\n".join([
+            "\n" + "=" * 60,
+            "MOCK ENVIRONMENT TEST RESULTS",
+            "=" * 60,
+            f"Tests run: {result.testsRun}",
+            f"Failures: {len(result.failures)}",
+            f"Errors: {len(result.errors)}",
+            f"Success: {result.wasSuccessful()}",
+        ]), flush=True)
         
         return 0 if result.wasSuccessful() else 1
         
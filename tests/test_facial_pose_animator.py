@@ -14,13 +14,9 @@ Date: Created for testing facial_pose_animator.py
 import unittest
 import sys
 import os
-import json
-import tempfile
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-
-# Add the current directory to sys.path so we can import the module under test
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import copy
+import contextlib
+from typing import List, Dict, Any, Optional, Tuple
 
 # Import Maya modules - these should be available in Maya environment
 import maya.cmds as cmds
@@ -29,69 +25,191 @@ import pymel.core as pm
 # Import the module under test
 from facialposecreator.facial_pose_animator import (
     FacialPoseAnimator, FacialPoseData, ControlSelectionMode,
-    FacialAnimatorError, ControlSelectionError, InvalidAttributeError,
+    _EXCLUDED_ATTRS, FacialAnimatorError, ControlSelectionError, InvalidAttributeError,
     DriverNodeError, FileOperationError, ObjectSetError, PoseDataError,
     create_facial_animator, quick_reset_facial_controls,
-    save_pose_from_selection, apply_saved_pose
+    save_pose_from_selection, apply_saved_pose, _json_dumps, _json_loads
+)
+
+
+# Saved copy of the test scene; reopening it replaces the ~20 build commands
+_SCENE_FIXTURE = None
+
+# (name, radius, translate) for each control in the test scene
+_TEST_CONTROL_SPECS = (
+    ("face_CTRL", 2, (0, 0, 0)),
+    ("mouth_CTRL", 1, (0, -1, 1)),
+    ("eye_L_CTRL", 0.5, (-1, 1, 1)),
+    ("eye_R_CTRL", 0.5, (1, 1, 1)),
 )
 
 
 def create_test_scene():
-    """Create a test Maya scene with facial controls for testing."""
+    """
+    Create a test Maya scene with facial controls for testing.
+    
+    The first call builds the scene command by command and saves it to a
+    per-process .ma file in the temp directory; later calls reopen that file.
+    """
+    global _SCENE_FIXTURE
+    if _SCENE_FIXTURE and os.path.exists(_SCENE_FIXTURE):
+        cmds.file(_SCENE_FIXTURE, open=True, force=True)
+        return tuple(name for name, _, _ in _TEST_CONTROL_SPECS)
+    
     # Clear scene
     cmds.file(new=True, force=True)
     
-    # Create test facial controls
-    test_controls = []
-    
     # Create main facial controls with CTRL suffix to match pattern
-    face_ctrl = cmds.circle(name="face_CTRL", radius=2)[0]
-    mouth_ctrl = cmds.circle(name="mouth_CTRL", radius=1)[0]
-    eye_l_ctrl = cmds.circle(name="eye_L_CTRL", radius=0.5)[0]
-    eye_r_ctrl = cmds.circle(name="eye_R_CTRL", radius=0.5)[0]
-    
-    test_controls.extend([face_ctrl, mouth_ctrl, eye_l_ctrl, eye_r_ctrl])
+    test_controls = tuple(cmds.circle(name=name, radius=radius)[0]
+                          for name, radius, _ in _TEST_CONTROL_SPECS)
     
-    # Position controls
-    cmds.move(0, 0, 0, face_ctrl)
-    cmds.move(0, -1, 1, mouth_ctrl)
-    cmds.move(-1, 1, 1, eye_l_ctrl)
-    cmds.move(1, 1, 1, eye_r_ctrl)
+    # Position controls with one compound setAttr per control
+    for ctrl, (_, _, position) in zip(test_controls, _TEST_CONTROL_SPECS):
+        cmds.setAttr(f"{ctrl}.translate", *position)
     
     # Add some custom attributes for testing
     for ctrl in test_controls:
         cmds.addAttr(ctrl, ln="smile", at="double", min=-1, max=1, dv=0, k=True)
         cmds.addAttr(ctrl, ln="frown", at="double", min=-1, max=1, dv=0, k=True)
     
+    # Save the built scene once so later calls can reopen it
+    import atexit
+    import tempfile
+    fixture = os.path.join(tempfile.gettempdir(), f"facial_pose_test_scene_{os.getpid()}.ma")
+    cmds.file(rename=fixture)
+    cmds.file(save=True, type="mayaAscii", force=True)
+    atexit.register(lambda: os.path.exists(fixture) and os.remove(fixture))
+    _SCENE_FIXTURE = fixture
+    
     return test_controls
 
 
+def clone_test_animator(prototype: FacialPoseAnimator) -> FacialPoseAnimator:
+    """
+    Return a copy of a prototype animator with its own mutable state.
+    
+    Copying skips re-running the constructor for every test while still
+    guaranteeing tests cannot leak poses, tracking data or settings into each other.
+    """
+    animator = copy.copy(prototype)
+    animator.excluded_nodes = list(prototype.excluded_nodes)
+    animator.excluded_attributes = prototype.excluded_attributes
+    animator.created_nodes = set()
+    animator.created_connections = {}
+    animator.created_attributes = {}
+    animator.saved_poses = {}
+    animator.last_frame_to_pose_map = {}
+    animator.limit_type_map = dict(prototype.limit_type_map)
+    animator.custom_limits = dict(prototype.custom_limits)
+    return animator
+
+
 def cleanup_test_scene():
     """Clean up test scene."""
     # Clear scene
     cmds.file(new=True, force=True)
 
 
+class MayaSceneTestCase(unittest.TestCase):
+    """
+    Base class for tests that share one Maya test scene per class.
+    
+    The scene from create_test_scene() is built once in setUpClass and put
+    back to its baseline after every test, instead of paying for
+    cmds.file(new=True) before and after each test. Tests that need an
+    empty scene call use_empty_scene(), which rebuilds the scene afterwards.
+    """
+    
+    test_controls: Tuple[str, ...] = ()
+    _rebuild_scene = False
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared scene and record its baseline state."""
+        super().setUpClass()
+        cls._build_scene()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Leave an empty scene for the next class."""
+        cleanup_test_scene()
+        super().tearDownClass()
+    
+    @classmethod
+    def _build_scene(cls):
+        """Create the test scene and snapshot its nodes, user attributes and values."""
+        cls.test_controls = create_test_scene()
+        cls._baseline_nodes = frozenset(cmds.ls())
+        cls._baseline_user_attrs = {
+            ctrl: frozenset(cmds.listAttr(ctrl, userDefined=True) or ())
+            for ctrl in cls.test_controls
+        }
+        cls._baseline_values = {
+            f"{ctrl}.{attr}": cmds.getAttr(f"{ctrl}.{attr}")
+            for ctrl in cls.test_controls
+            for attr in cmds.listAttr(ctrl, keyable=True) or ()
+        }
+    
+    def use_empty_scene(self):
+        """Switch to an empty scene for this test; the shared scene is rebuilt afterwards."""
+        cleanup_test_scene()
+        self._rebuild_scene = True
+    
+    def tearDown(self):
+        """Restore the shared scene to its baseline, rebuilding it if that is not possible."""
+        if not self._rebuild_scene:
+            try:
+                self._restore_scene()
+            except RuntimeError:
+                self._rebuild_scene = True
+        if self._rebuild_scene:
+            type(self)._build_scene()
+        super().tearDown()
+    
+    def _restore_scene(self):
+        """Undo test changes: extra nodes, added attributes, keys, values and selection."""
+        cmds.select(clear=True)
+        for node in cmds.ls():
+            if node not in self._baseline_nodes and cmds.objExists(node):
+                cmds.delete(node)
+        
+        for ctrl, baseline_attrs in self._baseline_user_attrs.items():
+            for attr in cmds.listAttr(ctrl, userDefined=True) or ():
+                if attr not in baseline_attrs:
+                    cmds.deleteAttr(f"{ctrl}.{attr}")
+        cmds.cutKey(self.test_controls, clear=True)
+        
+        for plug, value in self._baseline_values.items():
+            if cmds.getAttr(plug, lock=True):
+                cmds.setAttr(plug, lock=False)
+            if cmds.getAttr(plug) != value:
+                cmds.setAttr(plug, value)
+
+
 class TestFacialPoseData(unittest.TestCase):
     """Test cases for FacialPoseData dataclass."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.sample_controls = {
-            "face_ctrl": {
-                "translateX": 0.5,
-                "rotateY": 1.2
-            },
-            "mouth_ctrl": {
-                "translateZ": -0.3,
-                "rotateX": 0.8
-            }
+    _EXPECTED_FACE_ATTRS = {"translateX": 0.5, "rotateY": 1.2}
+    _SAMPLE_CONTROLS = {
+        "face_ctrl": {
+            "translateX": 0.5,
+            "rotateY": 1.2
+        },
+        "mouth_ctrl": {
+            "translateZ": -0.3,
+            "rotateX": 0.8
         }
+    }
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures (no test mutates them)."""
+        cls.sample_controls = cls._SAMPLE_CONTROLS
         
-        self.pose_data = FacialPoseData(
+        cls.pose_data = FacialPoseData(
             name="Test Pose",
             attribute_name="test_pose",
-            controls=self.sample_controls,
+            controls=cls.sample_controls,
             description="A test pose",
             timestamp="2024-01-01T12:00:00",
             maya_version="2024"
@@ -133,15 +251,10 @@ class TestFacialPoseData(unittest.TestCase):
         # Valid pose
         self.assertTrue(self.pose_data.is_valid())
         
-        # Invalid poses
-        invalid_pose1 = FacialPoseData("", "test", {})
-        self.assertFalse(invalid_pose1.is_valid())
-        
-        invalid_pose2 = FacialPoseData("Test", "", {})
-        self.assertFalse(invalid_pose2.is_valid())
-        
-        invalid_pose3 = FacialPoseData("Test", "test", {})
-        self.assertFalse(invalid_pose3.is_valid())
+        # Invalid poses: missing name, missing attribute name, no controls
+        for name, attribute_name in (("", "test"), ("Test", ""), ("Test", "test")):
+            with self.subTest(name=name, attribute_name=attribute_name):
+                self.assertFalse(FacialPoseData(name, attribute_name, {}).is_valid())
         
     def test_get_control_count(self):
         """Test control count calculation."""
@@ -153,18 +266,15 @@ class TestFacialPoseData(unittest.TestCase):
         
     def test_has_control(self):
         """Test control existence check."""
-        self.assertTrue(self.pose_data.has_control("face_ctrl"))
-        self.assertTrue(self.pose_data.has_control("mouth_ctrl"))
-        self.assertFalse(self.pose_data.has_control("nonexistent_ctrl"))
+        for control, expected in (("face_ctrl", True), ("mouth_ctrl", True), ("nonexistent_ctrl", False)):
+            with self.subTest(control=control):
+                self.assertEqual(self.pose_data.has_control(control), expected)
         
     def test_get_control_attributes(self):
         """Test getting control attributes."""
-        face_attrs = self.pose_data.get_control_attributes("face_ctrl")
-        expected = {"translateX": 0.5, "rotateY": 1.2}
-        self.assertEqual(face_attrs, expected)
-        
-        empty_attrs = self.pose_data.get_control_attributes("nonexistent")
-        self.assertEqual(empty_attrs, {})
+        for control, expected in (("face_ctrl", self._EXPECTED_FACE_ATTRS), ("nonexistent", {})):
+            with self.subTest(control=control):
+                self.assertEqual(self.pose_data.get_control_attributes(control), expected)
         
     def test_sanitize_attribute_name(self):
         """Test attribute name sanitization."""
@@ -188,10 +298,12 @@ class TestControlSelectionMode(unittest.TestCase):
     
     def test_enum_values(self):
         """Test enum value definitions."""
-        self.assertEqual(ControlSelectionMode.PATTERN.value, "pattern")
-        self.assertEqual(ControlSelectionMode.SELECTION.value, "selection")
-        self.assertEqual(ControlSelectionMode.OBJECT_SET.value, "object_set")
-        self.assertEqual(ControlSelectionMode.METADATA.value, "metadata")
+        for mode, value in ((ControlSelectionMode.PATTERN, "pattern"),
+                            (ControlSelectionMode.SELECTION, "selection"),
+                            (ControlSelectionMode.OBJECT_SET, "object_set"),
+                            (ControlSelectionMode.METADATA, "metadata")):
+            with self.subTest(mode=mode.name):
+                self.assertEqual(mode.value, value)
 
 
 class TestCustomExceptions(unittest.TestCase):
@@ -200,12 +312,10 @@ class TestCustomExceptions(unittest.TestCase):
     def test_exception_inheritance(self):
         """Test exception class inheritance."""
         self.assertTrue(issubclass(FacialAnimatorError, Exception))
-        self.assertTrue(issubclass(ControlSelectionError, FacialAnimatorError))
-        self.assertTrue(issubclass(InvalidAttributeError, FacialAnimatorError))
-        self.assertTrue(issubclass(DriverNodeError, FacialAnimatorError))
-        self.assertTrue(issubclass(FileOperationError, FacialAnimatorError))
-        self.assertTrue(issubclass(ObjectSetError, FacialAnimatorError))
-        self.assertTrue(issubclass(PoseDataError, FacialAnimatorError))
+        for error_class in (ControlSelectionError, InvalidAttributeError, DriverNodeError,
+                            FileOperationError, ObjectSetError, PoseDataError):
+            with self.subTest(error_class=error_class.__name__):
+                self.assertTrue(issubclass(error_class, FacialAnimatorError))
         
     def test_exception_raising(self):
         """Test that exceptions can be raised properly."""
@@ -216,17 +326,18 @@ class TestCustomExceptions(unittest.TestCase):
             raise InvalidAttributeError("Test message")
 
 
-class TestFacialPoseAnimatorInitialization(unittest.TestCase):
+class TestFacialPoseAnimatorInitialization(MayaSceneTestCase):
     """Test cases for FacialPoseAnimator initialization and basic methods."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared scene and the prototype animator shared by every test in the class."""
+        super().setUpClass()
+        cls._proto = FacialPoseAnimator()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.animator = FacialPoseAnimator()
-        cleanup_test_scene()
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        cleanup_test_scene()
+        self.animator = clone_test_animator(self._proto)
         
     def test_initialization(self):
         """Test proper initialization of FacialPoseAnimator."""
@@ -234,7 +345,7 @@ class TestFacialPoseAnimatorInitialization(unittest.TestCase):
         self.assertEqual(self.animator.facial_driver_node, "FacialPoseValue")
         self.assertEqual(self.animator.control_pattern, "::*_CTRL")
         self.assertEqual(self.animator.excluded_nodes, ["GUI", "pup"])
-        self.assertEqual(self.animator.excluded_attributes, ["scaleX", "scaleY", "scaleZ"])
+        self.assertEqual(self.animator.excluded_attributes, _EXCLUDED_ATTRS)
         self.assertEqual(self.animator.tolerance, 0.01)
         self.assertEqual(self.animator.default_selection_mode, ControlSelectionMode.PATTERN)
         self.assertIsNone(self.animator.default_object_set)
@@ -243,8 +354,8 @@ class TestFacialPoseAnimatorInitialization(unittest.TestCase):
         
     def test_is_valid_control(self):
         """Test control validation using real Maya objects."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
         # Get PyNode objects
         valid_ctrl = pm.PyNode(test_controls[0])  # face_CTRL
@@ -260,10 +371,38 @@ class TestFacialPoseAnimatorInitialization(unittest.TestCase):
         self.assertFalse(self.animator._is_valid_control(gui_pynode))
         self.assertFalse(self.animator._is_valid_control(pup_pynode))
         
+    def test_excluded_nodes_change_invalidates_pattern(self):
+        """Test edits to excluded_nodes, including in-place ones, take effect immediately."""
+        face_ctrl = pm.PyNode(self.test_controls[0])  # face_CTRL
+        self.assertTrue(self.animator._is_valid_control(face_ctrl))
+        
+        self.animator.excluded_nodes.append("face")
+        self.assertFalse(self.animator._is_valid_control(face_ctrl))
+        
+        self.animator.excluded_nodes = ["GUI"]
+        self.assertTrue(self.animator._is_valid_control(face_ctrl))
+        
+    def test_excluded_nodes_pattern(self):
+        """Test the compiled excluded-node pattern matches substring semantics."""
+        self.animator.excluded_nodes = ["GUI", "pup", "a.b"]
+        pattern = self.animator._excluded_nodes_pattern()
+        
+        # One name per excluded substring, at the start, middle and end
+        for name in ("GUI_face_CTRL", "lip_pup_CTRL", "ctrl_a.b"):
+            self.assertIsNotNone(pattern.search(name), name)
+        
+        # Names without an excluded substring; "aXb" checks that "." is literal
+        for name in ("face_CTRL", "gui_CTRL", "pu_p_CTRL", "aXb_CTRL"):
+            self.assertIsNone(pattern.search(name), name)
+        
+        # An empty exclusion list excludes nothing
+        self.animator.excluded_nodes = []
+        self.assertIsNone(self.animator._excluded_nodes_pattern())
+        
     def test_is_valid_attribute(self):
         """Test attribute validation using real Maya attributes."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         ctrl = pm.PyNode(test_controls[0])
         
         # Test valid attribute
@@ -283,6 +422,7 @@ class TestFacialPoseAnimatorInitialization(unittest.TestCase):
     def test_validate_scene_setup(self):
         """Test scene setup validation with real Maya scene."""
         # Test with empty scene
+        self.use_empty_scene()
         result = self.animator.validate_scene_setup()
         
         self.assertTrue(result["maya_available"])
@@ -309,25 +449,27 @@ class TestFacialPoseAnimatorInitialization(unittest.TestCase):
         self.assertEqual(self.animator.default_object_set, "test_set")
 
 
-class TestControlSelection(unittest.TestCase):
+class TestControlSelection(MayaSceneTestCase):
     """Test cases for control selection methods."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared scene, the prototype animator and the default pattern match."""
+        super().setUpClass()
+        cls._proto = FacialPoseAnimator()
+        cls._pattern_result = cls._proto._get_controls_from_pattern()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.animator = FacialPoseAnimator()
-        cleanup_test_scene()
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        cleanup_test_scene()
+        self.animator = clone_test_animator(self._proto)
         
     def test_get_controls_from_selection(self):
         """Test getting controls from Maya selection."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
         # Test with valid selection
-        pm.select([test_controls[0], test_controls[1]])
+        cmds.select([test_controls[0], test_controls[1]])
         
         result = self.animator._get_controls_from_selection()
         
@@ -335,42 +477,36 @@ class TestControlSelection(unittest.TestCase):
         self.assertEqual(result[0].nodeName(), "face_CTRL")
         
         # Test empty selection
-        pm.select(clear=True)
+        cmds.select(clear=True)
         
         with self.assertRaises(ControlSelectionError):
             self.animator._get_controls_from_selection()
             
     def test_get_controls_from_pattern(self):
         """Test getting controls from pattern matching."""
-        # Create test scene
-        test_controls = create_test_scene()
-        
-        result = self.animator._get_controls_from_pattern()
+        # The default pattern was matched once against the shared scene in setUpClass
+        result = self._pattern_result
         
         self.assertGreaterEqual(len(result), 2)  # Should find face_CTRL and mouth_CTRL
         
         # Verify control names contain "CTRL"
         for ctrl in result:
             self.assertIn("CTRL", ctrl.nodeName())
-        
-        # Test with modified pattern that matches nothing
-        original_pattern = self.animator.control_pattern
+    
+    def test_get_controls_from_pattern_no_match(self):
+        """Test pattern matching raises when nothing matches."""
         self.animator.control_pattern = "::*_NONEXISTENT"
         
         with self.assertRaises(ControlSelectionError):
             self.animator._get_controls_from_pattern()
             
-        # Restore original pattern
-        self.animator.control_pattern = original_pattern
-            
     def test_get_controls_from_object_set(self):
         """Test getting controls from object set."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
-        # Create an object set
-        object_set = cmds.sets(name="test_control_set", empty=True)
-        cmds.sets([test_controls[0], test_controls[1]], add=object_set)
+        # Create a populated object set in one call
+        cmds.sets([test_controls[0], test_controls[1]], name="test_control_set")
         
         result = self.animator._get_controls_from_object_set("test_control_set")
         
@@ -382,52 +518,52 @@ class TestControlSelection(unittest.TestCase):
             
     def test_get_facial_controls_with_modes(self):
         """Test get_facial_controls with different modes."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
         # Test PATTERN mode
         result = self.animator.get_facial_controls(mode=ControlSelectionMode.PATTERN)
         self.assertGreaterEqual(len(result), 2)
         
         # Test SELECTION mode
-        pm.select([test_controls[0]])
+        cmds.select([test_controls[0]])
         result = self.animator.get_facial_controls(mode=ControlSelectionMode.SELECTION)
         self.assertEqual(len(result), 1)
         
         # Test OBJECT_SET mode
-        object_set = cmds.sets(name="facial_control_set", empty=True)
-        cmds.sets([test_controls[0]], add=object_set)
+        cmds.sets([test_controls[0]], name="facial_control_set")
         result = self.animator.get_facial_controls(mode=ControlSelectionMode.OBJECT_SET, object_set_name="facial_control_set")
         self.assertEqual(len(result), 1)
 
 
-class TestPoseManagement(unittest.TestCase):
+class TestPoseManagement(MayaSceneTestCase):
     """Test cases for pose management functionality."""
     
+    _FACE_CTRL_ATTRS = dict(zip(("translateX", "rotateY"), (0.5, 1.2)))
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared scene and the prototype animator shared by every test in the class."""
+        super().setUpClass()
+        cls._proto = FacialPoseAnimator()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.animator = FacialPoseAnimator()
-        cleanup_test_scene()
+        self.animator = clone_test_animator(self._proto)
         
         # Create sample pose data
         self.sample_pose = FacialPoseData(
             name="Test Pose",
             attribute_name="test_pose",
-            controls={
-                "face_ctrl": {"translateX": 0.5, "rotateY": 1.2}
-            },
+            controls={"face_ctrl": copy.copy(self._FACE_CTRL_ATTRS)},
             description="Test pose for unit tests"
         )
         self.animator.saved_poses["Test Pose"] = self.sample_pose
         
-    def tearDown(self):
-        """Clean up after tests."""
-        cleanup_test_scene()
-        
     def test_save_pose_from_selection(self):
         """Test saving pose from selection."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
         # Set some attribute values
         ctrl_node = pm.PyNode(test_controls[0])
@@ -435,7 +571,7 @@ class TestPoseManagement(unittest.TestCase):
         ctrl_node.rotateY.set(1.2)
         
         # Select the control
-        pm.select([test_controls[0]])
+        cmds.select([test_controls[0]])
         
         result = self.animator.save_pose_from_selection(
             "New Pose", 
@@ -450,8 +586,8 @@ class TestPoseManagement(unittest.TestCase):
         
     def test_apply_saved_pose(self):
         """Test applying saved pose."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
         # Create a pose with real control data
         pose = FacialPoseData(
@@ -468,9 +604,8 @@ class TestPoseManagement(unittest.TestCase):
         self.assertTrue(result)
         
         # Verify the values were applied
-        ctrl_node = pm.PyNode("face_CTRL")
-        self.assertAlmostEqual(ctrl_node.translateX.get(), 1.5, places=2)
-        self.assertAlmostEqual(ctrl_node.translateY.get(), 0.8, places=2)
+        self.assertAlmostEqual(cmds.getAttr("face_CTRL.translateX"), 1.5, delta=0.005)
+        self.assertAlmostEqual(cmds.getAttr("face_CTRL.translateY"), 0.8, delta=0.005)
                 
         # Test non-existent pose
         with self.assertRaises(PoseDataError):
@@ -524,10 +659,32 @@ class TestPoseManagement(unittest.TestCase):
 class TestFileOperations(unittest.TestCase):
     """Test cases for file I/O operations."""
     
+    # Pose dict in the export format, keyed in FacialPoseData.to_dict() order
+    _IMPORTED_POSE = {
+        'name': 'Imported Pose',
+        'attribute_name': 'imported_pose',
+        'controls': {'ctrl': {'rotateX': 1.0}},
+        'description': 'Imported test pose',
+        'timestamp': '',
+        'maya_version': ''
+    }
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the prototype animator and a temporary directory shared by the class."""
+        import tempfile
+        cls._proto = FacialPoseAnimator()
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._tmp.name
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        cls._tmp.cleanup()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.animator = FacialPoseAnimator()
-        self.temp_dir = tempfile.mkdtemp()
+        self.animator = clone_test_animator(self._proto)
         
         # Add sample pose
         self.sample_pose = FacialPoseData(
@@ -536,15 +693,14 @@ class TestFileOperations(unittest.TestCase):
             controls={"ctrl": {"translateX": 0.5}}
         )
         self.animator.saved_poses["File Test Pose"] = self.sample_pose
-        
-    def tearDown(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _temp_file(self, extension: str) -> str:
+        """Return a path in the shared temp directory unique to the running test."""
+        return os.path.join(self.temp_dir, self.id() + extension)
         
     def test_export_poses_to_file(self):
         """Test exporting poses to file."""
-        test_file = os.path.join(self.temp_dir, "test_poses.json")
+        test_file = self._temp_file(".json")
         
         # Test successful export
         self.animator.export_poses_to_file(test_file)
@@ -552,44 +708,51 @@ class TestFileOperations(unittest.TestCase):
         self.assertTrue(os.path.exists(test_file))
         
         # Verify file content
-        with open(test_file, 'r') as f:
-            data = json.load(f)
+        with open(test_file, 'rb') as f:
+            data = _json_loads(f.read())
             
         self.assertIn('poses', data)
         self.assertIn('File Test Pose', data['poses'])
         
-    def test_import_poses_from_file(self):
-        """Test importing poses from file."""
-        test_file = os.path.join(self.temp_dir, "import_test.json")
+    def test_import_json_contract(self):
+        """Test that a poses file imports into poses that serialize back unchanged."""
+        test_file = self._temp_file(".json")
         
-        # Create test file
-        test_data = {
-            'poses': {
-                'Imported Pose': {
-                    'name': 'Imported Pose',
-                    'attribute_name': 'imported_pose',
-                    'controls': {'ctrl': {'rotateX': 1.0}},
-                    'description': 'Imported test pose',
-                    'timestamp': '',
-                    'maya_version': ''
-                }
-            }
-        }
-        
-        with open(test_file, 'w') as f:
-            json.dump(test_data, f)
+        with open(test_file, 'wb') as f:
+            f.write(_json_dumps({'poses': {'Imported Pose': self._IMPORTED_POSE}}))
             
         # Clear existing poses and import
         self.animator.saved_poses.clear()
         imported_names = self.animator.import_poses_from_file(test_file)
         
-        self.assertEqual(len(imported_names), 1)
-        self.assertIn('Imported Pose', imported_names)
-        self.assertIn('Imported Pose', self.animator.saved_poses)
+        self.assertEqual(imported_names, ['Imported Pose'])
+        self.assertEqual(_json_dumps(self.animator.saved_poses['Imported Pose'].to_dict()),
+                         _json_dumps(self._IMPORTED_POSE))
+        
+    def test_import_logic(self):
+        """Test import skip and overwrite rules on in-memory pose data."""
+        import_data = {'poses': {'Imported Pose': self._IMPORTED_POSE,
+                                 'File Test Pose': self._IMPORTED_POSE}}
+        
+        # An existing pose is kept unless overwriting is requested
+        results = list(self.animator.iter_import_poses(import_data))
+        self.assertEqual(results, [(1, 2, 'Imported Pose'), (2, 2, None)])
+        self.assertIs(self.animator.saved_poses['File Test Pose'], self.sample_pose)
+        
+        results = list(self.animator.iter_import_poses(import_data, overwrite_existing=True))
+        self.assertEqual(results, [(1, 2, 'Imported Pose'), (2, 2, 'File Test Pose')])
+        self.assertIsNot(self.animator.saved_poses['File Test Pose'], self.sample_pose)
+        
+    def test_import_rejects_non_object_poses(self):
+        """Test that pose data that is not a JSON object raises PoseDataError."""
+        for import_data in ({'poses': []}, {'export_type': 'single_pose', 'pose': []}):
+            with self.subTest(import_data=import_data):
+                with self.assertRaises(PoseDataError):
+                    list(self.animator.iter_import_poses(import_data))
         
     def test_load_single_pose_from_file(self):
         """Test loading single pose from file."""
-        test_file = os.path.join(self.temp_dir, "single_pose.json")
+        test_file = self._temp_file(".json")
         
         # Create single pose file
         test_data = {
@@ -604,8 +767,8 @@ class TestFileOperations(unittest.TestCase):
             }
         }
         
-        with open(test_file, 'w') as f:
-            json.dump(test_data, f)
+        with open(test_file, 'wb') as f:
+            f.write(_json_dumps(test_data))
             
         # Load the pose
         self.animator.saved_poses.clear()
@@ -616,15 +779,16 @@ class TestFileOperations(unittest.TestCase):
         
     def test_write_pose_names(self):
         """Test writing pose names to file."""
-        test_file = os.path.join(self.temp_dir, "pose_names.txt")
+        from unittest.mock import mock_open, patch
+        test_file = self._temp_file(".txt")
         pose_names = ["Pose1", "Pose2", "Pose3"]
         
-        self.animator._write_pose_names(pose_names, test_file)
-        
-        self.assertTrue(os.path.exists(test_file))
+        # Capture the write in memory instead of touching the disk
+        with patch("builtins.open", mock_open()) as mocked_open:
+            self.animator._write_pose_names(pose_names, test_file)
         
-        with open(test_file, 'r') as f:
-            content = f.read()
+        mocked_open.assert_called_once_with(test_file, "w")
+        content = "".join(mocked_open().writelines.call_args[0][0])
             
         for pose_name in pose_names:
             self.assertIn(pose_name, content)
@@ -633,9 +797,17 @@ class TestFileOperations(unittest.TestCase):
 class TestUndoTracking(unittest.TestCase):
     """Test cases for undo tracking system."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the animator shared by every test in the class."""
+        cls.animator = FacialPoseAnimator()
+    
     def setUp(self):
-        """Set up test fixtures."""
-        self.animator = FacialPoseAnimator()
+        """Reset the tracking state the tests touch."""
+        self.animator.enable_undo_tracking = True
+        self.animator.created_nodes.clear()
+        self.animator.created_connections.clear()
+        self.animator.created_attributes.clear()
         
     def test_track_created_node(self):
         """Test node tracking."""
@@ -685,17 +857,9 @@ class TestUndoTracking(unittest.TestCase):
         self.assertTrue(self.animator.enable_undo_tracking)
 
 
-class TestConvenienceFunctions(unittest.TestCase):
+class TestConvenienceFunctions(MayaSceneTestCase):
     """Test cases for convenience functions."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        cleanup_test_scene()
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        cleanup_test_scene()
-    
     def test_create_facial_animator(self):
         """Test creating facial animator instance."""
         animator = create_facial_animator()
@@ -704,14 +868,14 @@ class TestConvenienceFunctions(unittest.TestCase):
         
     def test_quick_reset_facial_controls(self):
         """Test quick reset function."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
         # Set some non-default values
-        ctrl = pm.PyNode(test_controls[0])
-        ctrl.translateX.set(1.5)
-        ctrl.translateY.set(2.0)
-        ctrl.rotateZ.set(45.0)
+        values = {"translateX": 1.5, "translateY": 2.0, "rotateZ": 45.0}
+        plugs = [f"{test_controls[0]}.{attr}" for attr in values]
+        for plug, value in zip(plugs, values.values()):
+            cmds.setAttr(plug, value)
         
         # Reset controls
         result = quick_reset_facial_controls()
@@ -719,21 +883,20 @@ class TestConvenienceFunctions(unittest.TestCase):
         self.assertTrue(result)
         
         # Verify values were reset (should be close to zero)
-        self.assertAlmostEqual(ctrl.translateX.get(), 0.0, places=2)
-        self.assertAlmostEqual(ctrl.translateY.get(), 0.0, places=2)
-        self.assertAlmostEqual(ctrl.rotateZ.get(), 0.0, places=2)
+        for plug in plugs:
+            self.assertAlmostEqual(cmds.getAttr(plug), 0.0, delta=0.005, msg=plug)
         
     def test_save_pose_from_selection_convenience(self):
         """Test convenience function for saving pose from selection."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
         # Set some attribute values
         ctrl = pm.PyNode(test_controls[0])
         ctrl.translateX.set(0.5)
         
         # Select the control
-        pm.select([test_controls[0]])
+        cmds.select([test_controls[0]])
         
         result = save_pose_from_selection("Test Pose")
         
@@ -741,39 +904,36 @@ class TestConvenienceFunctions(unittest.TestCase):
         self.assertEqual(result.name, "Test Pose")
 
 
-class TestMayaOperationsReal(unittest.TestCase):
+class TestMayaOperationsReal(MayaSceneTestCase):
     """Test cases for Maya operations with real Maya environment."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared scene and the prototype animator shared by every test in the class."""
+        super().setUpClass()
+        cls._proto = FacialPoseAnimator()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.animator = FacialPoseAnimator()
-        cleanup_test_scene()
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        cleanup_test_scene()
+        self.animator = clone_test_animator(self._proto)
         
     def test_reset_all_attributes(self):
         """Test resetting all attributes with real Maya objects."""
-        # Create test scene
-        test_controls = create_test_scene()
+        # Use the shared test scene
+        test_controls = self.test_controls
         
         # Set some non-default values
-        for ctrl_name in test_controls:
-            ctrl = pm.PyNode(ctrl_name)
-            ctrl.translateX.set(1.0)
-            ctrl.translateY.set(0.5)
-            ctrl.rotateZ.set(30.0)
+        values = {"translateX": 1.0, "translateY": 0.5, "rotateZ": 30.0}
+        plugs = [f"{ctrl}.{attr}" for ctrl in test_controls for attr in values]
+        for plug in plugs:
+            cmds.setAttr(plug, values[plug.rsplit(".", 1)[1]])
         
         # Reset all attributes
         self.animator.reset_all_attributes()
         
         # Verify all values are back to defaults (close to zero)
-        for ctrl_name in test_controls:
-            ctrl = pm.PyNode(ctrl_name)
-            self.assertAlmostEqual(ctrl.translateX.get(), 0.0, places=2)
-            self.assertAlmostEqual(ctrl.translateY.get(), 0.0, places=2)
-            self.assertAlmostEqual(ctrl.rotateZ.get(), 0.0, places=2)
+        for plug, value in zip(plugs, [cmds.getAttr(plug) for plug in plugs]):
+            self.assertAlmostEqual(value, 0.0, delta=0.005, msg=plug)
 
 
 # Integration test suite runner
@@ -781,80 +941,106 @@ class FacialPoseAnimatorTestSuite:
     """Test suite runner for the facial pose animator tests."""
     
     @staticmethod
-    def run_all_tests():
-        """Run all test cases and return results."""
-        # Create test suite
+    def run(names: Optional[List[str]] = None, failfast: bool = False,
+            output_dir: Optional[str] = None, quiet: bool = False) -> unittest.TestResult:
+        """
+        Run the named tests, or the whole suite, and return results.
+        
+        Args:
+            names: Test class or "Class.test_method" names; None runs every test
+            failfast: Stop at the first failure or error
+            output_dir: Directory for JUnit XML reports (written when xmlrunner is installed)
+            quiet: Discard per-test progress output
+        """
         loader = unittest.TestLoader()
-        suite = unittest.TestSuite()
-        
-        # Add all test classes
-        test_classes = [
-            TestFacialPoseData,
-            TestControlSelectionMode,
-            TestCustomExceptions,
-            TestFacialPoseAnimatorInitialization,
-            TestControlSelection,
-            TestPoseManagement,
-            TestFileOperations,
-            TestUndoTracking,
-            TestConvenienceFunctions,
-            TestMayaOperationsReal
-        ]
-        
-        for test_class in test_classes:
-            tests = loader.loadTestsFromTestCase(test_class)
-            suite.addTests(tests)
-        
-        # Run tests
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
-        
-        return result
+        # dir() already yields method names in sorted order, so skip the loader's re-sort
+        loader.sortTestMethodsUsing = None
+        if names:
+            test_classes = FacialPoseAnimatorTestSuite._test_classes()
+            suite = unittest.TestSuite(
+                loader.loadTestsFromTestCase(test_classes[name]) if name in test_classes
+                else loader.loadTestsFromName(name, sys.modules[__name__])
+                for name in names
+            )
+        else:
+            suite = FacialPoseAnimatorTestSuite._load_all_tests(loader)
+        return FacialPoseAnimatorTestSuite._run_suite(suite, failfast, output_dir, quiet)
     
     @staticmethod
-    def run_specific_test(test_class_name: str):
-        """Run a specific test class."""
-        import sys
-        loader = unittest.TestLoader()
+    def _load_all_tests(loader: unittest.TestLoader) -> unittest.TestSuite:
+        """Load every test, applying sharding when it is configured."""
+        suite = FacialPoseAnimatorTestSuite._discover_all_tests(loader)
         
-        # Try to get the test class from the current module
-        current_module = sys.modules[__name__]
-        if hasattr(current_module, test_class_name):
-            test_class = getattr(current_module, test_class_name)
-            suite = loader.loadTestsFromTestCase(test_class)
-        else:
-            # Fallback to name-based loading for __main__ context
-            suite = loader.loadTestsFromName(f'__main__.{test_class_name}')
+        # Keep only this container's share of the classes when sharding is configured
+        shard_index = int(os.environ.get("TEST_SHARD_INDEX", 0))
+        shard_count = int(os.environ.get("TEST_SHARD_COUNT", 1))
+        if shard_count > 1:
+            suite = FacialPoseAnimatorTestSuite._shard(suite, shard_index, shard_count)
         
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
-        
-        return result
+        return suite
+    
+    @staticmethod
+    def _shard(suite: unittest.TestSuite, index: int, count: int) -> unittest.TestSuite:
+        """
+        Select every count-th test class starting at index.
+        
+        Whole classes are kept together so class-level fixtures run once per shard.
+        """
+        tests = list(FacialPoseAnimatorTestSuite._iter_tests(suite))
+        class_names = list(dict.fromkeys(type(test).__name__ for test in tests))
+        selected = set(class_names[index::count])
+        return unittest.TestSuite(test for test in tests if type(test).__name__ in selected)
+    
+    @staticmethod
+    def _run_suite(suite: unittest.TestSuite, failfast: bool = False,
+                   output_dir: Optional[str] = None, quiet: bool = False) -> unittest.TestResult:
+        """
+        Run a suite with a JUnit XML runner when possible, or a text runner otherwise.
+        
+        In quiet mode the per-test progress stream goes to os.devnull; callers
+        report the returned result themselves.
+        """
+        verbosity = 0 if quiet else 2
+        with open(os.devnull, "w") if quiet else contextlib.nullcontext(sys.stderr) as stream:
+            if output_dir:
+                try:
+                    import xmlrunner
+                except ImportError:
+                    pass
+                else:
+                    runner = xmlrunner.XMLTestRunner(output=output_dir, stream=stream,
+                                                     verbosity=verbosity, failfast=failfast)
+                    return runner.run(suite)
+            runner = unittest.TextTestRunner(stream=stream, verbosity=verbosity, failfast=failfast)
+            return runner.run(suite)
+    
+    @staticmethod
+    def _iter_tests(suite: unittest.TestSuite):
+        """Yield the individual test cases of a possibly nested suite."""
+        for test in suite:
+            if isinstance(test, unittest.TestSuite):
+                yield from FacialPoseAnimatorTestSuite._iter_tests(test)
+            else:
+                yield test
+    
+    @staticmethod
+    def _discover_all_tests(loader: unittest.TestLoader) -> unittest.TestSuite:
+        """Load every TestCase class defined in this module."""
+        return loader.loadTestsFromModule(sys.modules[__name__])
+    
+    @staticmethod
+    def _test_classes() -> Dict[str, type]:
+        """
+        Map class names to the TestCase classes in this module.
+        
+        Uses the same rule as loadTestsFromModule, so a new test class is found
+        by name without being registered anywhere.
+        """
+        return {name: obj for name, obj in vars(sys.modules[__name__]).items()
+                if isinstance(obj, type) and issubclass(obj, unittest.TestCase)}
 
 
 if __name__ == '__main__':
-    # Run all tests when script is executed directly
-    print("Running Facial Pose Animator Unit Tests")
-    print("=" * 50)
-    
-    test_suite = FacialPoseAnimatorTestSuite()
-    result = test_suite.run_all_tests()
-    
-    # Print summary
-    print("\n" + "=" * 50)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    
-    if result.failures:
-        print("\nFailures:")
-        for test, traceback in result.failures:
-            print(f"  - {test}: {traceback}")
-            
-    if result.errors:
-        print("\nErrors:")
-        for test, traceback in result.errors:
-            print(f"  - {test}: {traceback}")
-    
-    # Exit with appropriate code
-    sys.exit(0 if result.wasSuccessful() else 1)
\ No newline at end of file
+    # Run all tests when script is executed directly; buffer=True holds each
+    # test's stdout in memory and only shows it for failures and errors
+    unittest.main(buffer=True, verbosity=1)
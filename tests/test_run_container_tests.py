@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+"""
+Unit tests for run_container_tests.py
+
+Author: Test Suite
+Date: Created for testing run_container_tests.py
+"""
+
+import unittest
+
+import test_facial_pose_animator
+from run_container_tests import collect_test_ids
+
+
+class TestCollectTestIds(unittest.TestCase):
+    """Test cases for the container runner's import-free test collection."""
+    
+    def test_collected_ids_match_loader(self):
+        """Test that --collect-only lists exactly the tests the loader finds."""
+        def class_and_method(test_id):
+            return ".".join(test_id.split(".")[-2:])
+        
+        collected = [class_and_method(test_id) for test_id in collect_test_ids()]
+        suite = unittest.TestLoader().loadTestsFromModule(test_facial_pose_animator)
+        loaded = [class_and_method(test.id())
+                  for test in test_facial_pose_animator.FacialPoseAnimatorTestSuite._iter_tests(suite)]
+        
+        self.assertEqual(len(collected), len(loaded))
+        self.assertEqual(sorted(collected), sorted(loaded))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Unit tests for uninstall.py
+
+Covers the package removal helpers against real temporary directory trees.
+No Maya calls are made.
+
+Author: Test Suite
+Date: Created for testing uninstall.py
+"""
+
+import unittest
+import sys
+import os
+import contextlib
+import tempfile
+
+# The uninstaller lives at the repository root, one level above this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uninstall
+
+
+class TestUninstallRemoval(unittest.TestCase):
+    """Test cases for the uninstaller's package removal."""
+    
+    def setUp(self):
+        """Create a checkout with a scripts directory that links the package to it."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        
+        self.checkout = os.path.join(tmp.name, "checkout")
+        os.makedirs(os.path.join(self.checkout, "sub"))
+        for name in ("__init__.py", os.path.join("sub", "module.py")):
+            open(os.path.join(self.checkout, name), "w").close()
+        
+        os.mkdir(os.path.join(tmp.name, "scripts"))
+        self.package_link = os.path.join(tmp.name, "scripts", "facialposecreator")
+        try:
+            os.symlink(self.checkout, self.package_link, target_is_directory=True)
+        except (OSError, NotImplementedError) as e:
+            self.skipTest(f"Cannot create symlinks here: {e}")
+    
+    def test_symlinked_package_removes_only_link(self):
+        """Test that removing a symlinked package leaves the link target intact."""
+        for rmtree in (uninstall._fast_rmtree, uninstall._fast_rmtree_portable):
+            with self.subTest(rmtree=rmtree.__name__):
+                if not os.path.lexists(self.package_link):
+                    os.symlink(self.checkout, self.package_link, target_is_directory=True)
+                
+                rmtree(self.package_link)
+                
+                self.assertFalse(os.path.lexists(self.package_link))
+                self.assertTrue(os.path.isfile(os.path.join(self.checkout, "sub", "module.py")))
+    
+    def test_nested_tree_removed(self):
+        """Test that both removal functions delete a real nested directory tree."""
+        for rmtree in (uninstall._fast_rmtree, uninstall._fast_rmtree_portable):
+            with self.subTest(rmtree=rmtree.__name__):
+                package_dir = os.path.join(os.path.dirname(self.checkout), "installed")
+                os.makedirs(os.path.join(package_dir, "sub", "deeper"))
+                for name in ("__init__.py", os.path.join("sub", "a.py"), os.path.join("sub", "deeper", "b.py")):
+                    open(os.path.join(package_dir, name), "w").close()
+                
+                rmtree(package_dir)
+                
+                self.assertFalse(os.path.lexists(package_dir))
+    
+    def test_remove_package_with_symlinked_package(self):
+        """Test remove_package on a symlinked install, then on an already removed one."""
+        uninstaller = uninstall.FacialPoseToolsUninstaller.__new__(uninstall.FacialPoseToolsUninstaller)
+        uninstaller._package_dir = self.package_link
+        uninstaller.removed_items = []
+        
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            self.assertTrue(uninstaller.remove_package())
+            self.assertFalse(uninstaller.remove_package())
+        
+        self.assertFalse(os.path.lexists(self.package_link))
+        self.assertTrue(os.path.isfile(os.path.join(self.checkout, "__init__.py")))
+
+
+if __name__ == '__main__':
+    unittest.main()
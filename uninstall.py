@@ -14,18 +14,155 @@ Date: October 1, 2025
 """
 
 import os
+import re
+import importlib.util
+import mmap
 import sys
 import shutil
+import stat
 from pathlib import Path
 
-try:
-    import maya.cmds as cmds
-    import maya.mel as mel
-    MAYA_AVAILABLE = True
-except ImportError:
-    MAYA_AVAILABLE = False
+
+def _maya_available():
+    """Check for maya.cmds without importing it (find_spec only locates the module)."""
+    try:
+        return importlib.util.find_spec("maya.cmds") is not None
+    except ImportError:
+        return False
+
+
+MAYA_AVAILABLE = _maya_available()
+if not MAYA_AVAILABLE:
     print("Warning: This uninstaller must be run from within Maya")
 
+_USERSETUP_MARKER = b"Facial Pose Tools"
+
+# A marker line plus the lines after it that belong to the installer's
+# userSetup block: blank lines, imports and the scripts_dir setup
+_USERSETUP_BLOCK_RE = re.compile(
+    rb'(?m)^[^\n]*' + re.escape(_USERSETUP_MARKER) + rb'[^\n]*(?:\n|\Z)'
+    rb'(?:(?:[ \t\r\f\v]*|import[^\n]*|scripts_dir[^\n]*)(?:\n|\Z))*'
+)
+
+# Directory fds _fast_rmtree keeps open at once; deeper levels are removed by path
+_RMTREE_MAX_FDS = 16
+
+
+def _fast_rmtree(path):
+    """
+    Delete a directory tree using directory-relative unlink/rmdir calls.
+    
+    Entries are resolved against an open directory fd rather than a full path,
+    and their types come from scandir without an extra stat. Platforms without
+    dir_fd support (Windows) use _fast_rmtree_portable.
+    
+    A symlinked path (e.g. a package linked to a development checkout) is
+    removed as a link; its target is left untouched.
+    """
+    if _remove_if_link(path):
+        return
+    if not (hasattr(os, "O_DIRECTORY") and os.scandir in os.supports_fd
+            and os.unlink in os.supports_dir_fd and os.rmdir in os.supports_dir_fd):
+        _fast_rmtree_portable(path)
+        return
+    
+    # O_NOFOLLOW closes the window between the link check and the open
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_NOFOLLOW", 0))
+    try:
+        _rmtree_at(fd, os.fspath(path), 1)
+    finally:
+        os.close(fd)
+    os.rmdir(path)
+
+
+def _fast_rmtree_portable(path):
+    """
+    Delete a directory tree bottom-up with os.walk.
+    
+    Removes the names os.walk already listed, without the per-entry stat and
+    error-retry handling of shutil.rmtree. Symlinked directories, including
+    path itself, are removed as links, never followed.
+    """
+    def _raise(error):
+        raise error
+    
+    if _remove_if_link(path):
+        return
+    
+    for root, dirs, files in os.walk(path, topdown=False, onerror=_raise):
+        for name in files:
+            os.remove(os.path.join(root, name))
+        for name in dirs:
+            # Real subdirectories were removed on their own pass; only links remain
+            link = os.path.join(root, name)
+            if os.path.islink(link):
+                _remove_link(link)
+        os.rmdir(root)
+
+
+def _remove_if_link(path):
+    """
+    Remove path if it is a symlink, returning whether it was one.
+    
+    Raises FileNotFoundError if path does not exist.
+    """
+    if not stat.S_ISLNK(os.lstat(path).st_mode):
+        return False
+    _remove_link(path)
+    return True
+
+
+def _remove_link(path):
+    """Remove a symlink without touching its target."""
+    if os.name == "nt":
+        os.rmdir(path)  # Windows removes directory links with rmdir
+    else:
+        os.remove(path)
+
+
+def _rmtree_at(dir_fd, dir_path, depth):
+    """Empty the directory open as dir_fd (located at dir_path) without removing it."""
+    with os.scandir(dir_fd) as it:
+        entries = list(it)
+    
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False):
+            # Files and symlinks (including links to directories) are unlinked
+            os.unlink(entry.name, dir_fd=dir_fd)
+            continue
+        
+        if depth < _RMTREE_MAX_FDS:
+            flags = os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_NOFOLLOW", 0)
+            child_fd = os.open(entry.name, flags, dir_fd=dir_fd)
+            try:
+                _rmtree_at(child_fd, os.path.join(dir_path, entry.name), depth + 1)
+            finally:
+                os.close(child_fd)
+            os.rmdir(entry.name, dir_fd=dir_fd)
+        else:
+            shutil.rmtree(os.path.join(dir_path, entry.name))
+
+
+def _read_if_contains(f, needle):
+    """
+    Return the contents of a binary file only if it contains needle, else None.
+    
+    The file is scanned through a read-only memory map, so a file without the
+    needle is never copied into memory.
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # Empty files cannot be mapped
+        return None
+    with mm:
+        return mm[:] if mm.find(needle) != -1 else None
+
+
+def _count_lines(data):
+    """Count lines in a bytes buffer, including a final line without a newline."""
+    return data.count(b"\n") + (bool(data) and not data.endswith(b"\n"))
+
 
 class FacialPoseToolsUninstaller:
     """Uninstaller for Facial Pose Tools in Maya."""
@@ -35,126 +172,139 @@ class FacialPoseToolsUninstaller:
         
         # Get Maya directories
         if MAYA_AVAILABLE:
-            self.maya_app_dir = Path(cmds.internalVar(userAppDir=True))
+            self.maya_app_dir = Path(self._cmds.internalVar(userAppDir=True))
             self.maya_scripts_dir = self.maya_app_dir / "scripts"
             self.maya_shelves_dir = self.maya_app_dir / "prefs" / "shelves"
             self.maya_modules_dir = self.maya_app_dir / "modules"
+            
+            # Paths of the installed items, resolved once for every step
+            self._package_dir = self.maya_scripts_dir / self.package_name
+            self._usersetup_path = self.maya_scripts_dir / "userSetup.py"
+            self._mod_file = self.maya_modules_dir / f"{self.package_name}.mod"
         else:
             self.maya_app_dir = None
             self.maya_scripts_dir = None
             self.maya_shelves_dir = None
             self.maya_modules_dir = None
+            self._package_dir = None
+            self._usersetup_path = None
+            self._mod_file = None
         
         self.removed_items = []
     
+    @property
+    def _cmds(self):
+        """maya.cmds, imported on first use rather than when this file is loaded."""
+        import maya.cmds
+        return maya.cmds
+    
+    @property
+    def _mel(self):
+        """maya.mel, imported on first use."""
+        import maya.mel
+        return maya.mel
+    
+    def _shelf_button_label(self, button):
+        """Return a shelf child's label, or None for separators and other non-buttons."""
+        # Check the control type up front rather than letting the query fail
+        if self._cmds.objectTypeUI(button) != "shelfButton":
+            return None
+        return self._cmds.shelfButton(button, query=True, label=True)
+    
     def remove_package(self):
         """Remove the facialposecreator package from Maya scripts directory."""
-        package_dir = self.maya_scripts_dir / self.package_name
+        package_dir = self._package_dir
         
-        if package_dir.exists():
-            print(f"Removing package: {package_dir}")
-            shutil.rmtree(package_dir)
-            self.removed_items.append(f"Package directory: {package_dir}")
-            print("✓ Package removed")
-            return True
-        else:
+        try:
+            _fast_rmtree(package_dir)
+        except FileNotFoundError:
             print("Package directory not found (already removed or not installed)")
             return False
+        
+        print(f"Removed package: {package_dir}")
+        self.removed_items.append(f"Package directory: {package_dir}")
+        print("✓ Package removed")
+        return True
     
     def remove_shelf_button(self):
         """Remove the shelf button for Facial Pose Tools."""
         shelf_name = "Custom"
         button_label = "FacialPose"
         
-        if not cmds.shelfLayout(shelf_name, exists=True):
+        # Get all buttons on the shelf; the query itself fails if the shelf is missing
+        try:
+            shelf_buttons = self._cmds.shelfLayout(shelf_name, query=True, childArray=True) or []
+        except RuntimeError:
             print(f"Shelf '{shelf_name}' not found")
             return False
+        labels = [self._shelf_button_label(button) for button in shelf_buttons]
+        matches = [button for button, label in zip(shelf_buttons, labels) if label == button_label]
         
-        # Get all buttons on the shelf
-        shelf_buttons = cmds.shelfLayout(shelf_name, query=True, childArray=True) or []
-        removed = False
+        if not matches:
+            print("Shelf button not found (already removed or not installed)")
+            return False
         
-        for button in shelf_buttons:
-            try:
-                label = cmds.shelfButton(button, query=True, label=True)
-                if label == button_label:
-                    print(f"Removing shelf button: {button}")
-                    cmds.deleteUI(button)
-                    self.removed_items.append(f"Shelf button: {button_label}")
-                    removed = True
-                    print("✓ Shelf button removed")
-            except:
-                pass
+        print(f"Removing shelf button: {', '.join(matches)}")
+        self._cmds.deleteUI(matches)
+        self.removed_items.extend([f"Shelf button: {button_label}"] * len(matches))
+        print("✓ Shelf button removed")
         
-        if removed:
-            # Save shelf
+        # Maya saves shelves on exit; writing the shelf now is opt-in, and only
+        # the shelf we changed is written rather than every shelf
+        if os.environ.get("FACIALPOSE_SAVE_SHELF"):
             try:
-                mel.eval(f'saveAllShelves $gShelfTopLevel;')
+                shelf_file = Path(self._cmds.internalVar(userShelfDir=True)) / f"shelf_{shelf_name}"
+                self._mel.eval(f'saveShelf "{shelf_name}" "{shelf_file.as_posix()}";')
                 print("✓ Shelf saved")
             except:
                 print("Note: Please save shelf manually if needed")
-        else:
-            print("Shelf button not found (already removed or not installed)")
         
-        return removed
+        return True
     
     def clean_usersetup(self):
         """Remove Facial Pose Tools entries from userSetup.py."""
-        usersetup_path = self.maya_scripts_dir / "userSetup.py"
+        usersetup_path = self._usersetup_path
         
-        if not usersetup_path.exists():
+        try:
+            with open(usersetup_path, 'rb') as f:
+                data = _read_if_contains(f, _USERSETUP_MARKER)
+        except FileNotFoundError:
             print("userSetup.py not found")
             return False
         
-        with open(usersetup_path, 'r') as f:
-            lines = f.readlines()
+        if data is None:
+            print("No Facial Pose Tools entries found in userSetup.py")
+            return False
         
-        # Filter out lines related to Facial Pose Tools
-        new_lines = []
-        skip_block = False
-        removed_lines = 0
+        # Drop each marker line and the block that follows it in one pass
+        cleaned, _ = _USERSETUP_BLOCK_RE.subn(b"", data)
+        removed_lines = _count_lines(data) - _count_lines(cleaned)
         
-        for line in lines:
-            if "Facial Pose Tools" in line:
-                skip_block = True
-                removed_lines += 1
-                continue
-            
-            if skip_block:
-                # Skip empty lines and related code after marker
-                if line.strip() == "" or line.startswith("import") or line.startswith("scripts_dir"):
-                    removed_lines += 1
-                    continue
-                else:
-                    skip_block = False
-            
-            new_lines.append(line)
+        # Write back the cleaned content
+        usersetup_path.write_bytes(cleaned)
         
-        if removed_lines > 0:
-            # Write back the cleaned content
-            with open(usersetup_path, 'w') as f:
-                f.writelines(new_lines)
-            
-            self.removed_items.append(f"userSetup.py entries ({removed_lines} lines)")
-            print(f"✓ Cleaned userSetup.py ({removed_lines} lines removed)")
-            return True
-        else:
-            print("No Facial Pose Tools entries found in userSetup.py")
-            return False
+        self.removed_items.append(f"userSetup.py entries ({removed_lines} lines)")
+        print(f"✓ Cleaned userSetup.py ({removed_lines} lines removed)")
+        return True
     
     def remove_module_file(self):
         """Remove the .mod file."""
-        mod_file = self.maya_modules_dir / f"{self.package_name}.mod"
+        mod_file = self._mod_file
         
-        if mod_file.exists():
-            print(f"Removing module file: {mod_file}")
-            os.remove(mod_file)
-            self.removed_items.append(f"Module file: {mod_file.name}")
-            print("✓ Module file removed")
-            return True
-        else:
+        try:
+            mod_file.unlink()
+        except FileNotFoundError:
             print("Module file not found (already removed or not installed)")
             return False
+        
+        print(f"Removed module file: {mod_file}")
+        self.removed_items.append(f"Module file: {mod_file.name}")
+        print("✓ Module file removed")
+        return True
+    
+    def is_installed(self):
+        """Check for the package directory or module file with at most two stats."""
+        return self._package_dir.is_dir() or self._mod_file.is_file()
     
     def uninstall(self):
         """Run the full uninstallation process."""
@@ -167,8 +317,18 @@ class FacialPoseToolsUninstaller:
             print("Please drag and drop this file into Maya's viewport")
             return False
         
+        if not self.is_installed():
+            print("Facial Pose Tools is not installed; nothing to uninstall")
+            self._cmds.confirmDialog(
+                title="Uninstall Facial Pose Tools",
+                message="Facial Pose Tools is not installed. Nothing to uninstall.",
+                button=["OK"],
+                defaultButton="OK"
+            )
+            return False
+        
         # Confirm uninstallation
-        result = cmds.confirmDialog(
+        result = self._cmds.confirmDialog(
             title="Uninstall Facial Pose Tools",
             message="Are you sure you want to uninstall Facial Pose Tools?\n\n"
                     "This will remove:\n"
@@ -187,21 +347,27 @@ class FacialPoseToolsUninstaller:
             return False
         
         try:
-            # Step 1: Remove package
-            print("\n[1/4] Removing package...")
-            self.remove_package()
-            
-            # Step 2: Remove shelf button
-            print("\n[2/4] Removing shelf button...")
-            self.remove_shelf_button()
-            
-            # Step 3: Clean userSetup.py
-            print("\n[3/4] Cleaning userSetup.py...")
-            self.clean_usersetup()
-            
-            # Step 4: Remove module file
-            print("\n[4/4] Removing module file...")
-            self.remove_module_file()
+            # Suspend viewport refresh so the UI and scene changes below do not
+            # trigger redraws (and the scene scans some plugins run on them)
+            self._cmds.refresh(suspend=True)
+            try:
+                # Step 1: Remove package
+                print("\n[1/4] Removing package...")
+                self.remove_package()
+                
+                # Step 2: Remove shelf button
+                print("\n[2/4] Removing shelf button...")
+                self.remove_shelf_button()
+                
+                # Step 3: Clean userSetup.py
+                print("\n[3/4] Cleaning userSetup.py...")
+                self.clean_usersetup()
+                
+                # Step 4: Remove module file
+                print("\n[4/4] Removing module file...")
+                self.remove_module_file()
+            finally:
+                self._cmds.refresh(suspend=False)
             
             print("\n" + "="*60)
             print("✓ Uninstallation Complete!")
@@ -218,7 +384,7 @@ class FacialPoseToolsUninstaller:
             print("\nNote: You may need to restart Maya for all changes to take effect.")
             
             # Show confirmation dialog
-            cmds.confirmDialog(
+            self._cmds.confirmDialog(
                 title="Uninstallation Complete",
                 message="Facial Pose Tools have been uninstalled successfully!\n\n"
                         "You may need to restart Maya for all changes to take effect.",
@@ -234,7 +400,7 @@ class FacialPoseToolsUninstaller:
             traceback.print_exc()
             
             # Show error dialog
-            cmds.confirmDialog(
+            self._cmds.confirmDialog(
                 title="Uninstallation Failed",
                 message=f"Uninstallation failed with error:\n\n{str(e)}\n\n"
                         "Please check the Script Editor for details.",